@@ -10,7 +10,12 @@ Setup:
 3. Run this script: python examples/bot_usage.py
 """
 
+import asyncio
+import codecs
+import functools
+import io
 import os
+import re
 import logging
 from pathlib import Path
 from televoica.core.engine import SpeechToTextEngine
@@ -18,9 +23,69 @@ from televoica.core.providers import WhisperProvider
 from televoica.bot.telegram_bot import TelegramSTTBot
 from televoica.config.settings import load_config
 
+# Matches "KEY=value" entries the way python-dotenv does: an optional
+# "export", then a single-quoted, double-quoted (possibly multi-line) or bare
+# value. Blank and comment lines never match.
+_ENV_RE = re.compile(
+    r"""^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_.]*)[ \t]*=[ \t]*"""
+    r"""(?:'((?:\\'|[^'])*)'|"((?:\\"|[^"])*)"|([^\r\n]*))""",
+    re.M,
+)
+
+# Escape sequences python-dotenv expands in single- and double-quoted values
+_SINGLE_QUOTE_ESCAPES = re.compile(r"\\[\\']")
+_DOUBLE_QUOTE_ESCAPES = re.compile(r"\\[\\'\"abfnrtv]")
+
+# Inline comment after a bare value; the "#" must follow whitespace
+_INLINE_COMMENT = re.compile(r"\s+#.*")
+
+_LOGGING_READY = False
+
+
+def _setup_logging():
+    """Configure logging once, no matter how many entry points call this."""
+    global _LOGGING_READY
+    if _LOGGING_READY:
+        return
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    _LOGGING_READY = True
+
+
+def _decode_escapes(pattern: re.Pattern, value: str) -> str:
+    """Expand the escape sequences matched by pattern."""
+    return pattern.sub(lambda match: codecs.decode(match.group(0), "unicode-escape"), value)
+
+
+def _parse_env(text: str) -> dict:
+    """
+    Parse .env contents without python-dotenv.
+
+    Quotes, escapes and inline comments are handled like python-dotenv;
+    variable interpolation is not supported.
+    """
+    values = {}
+    for match in _ENV_RE.finditer(text):
+        key, single, double, bare = match.groups()
+        if single is not None:
+            values[key] = _decode_escapes(_SINGLE_QUOTE_ESCAPES, single)
+        elif double is not None:
+            values[key] = _decode_escapes(_DOUBLE_QUOTE_ESCAPES, double)
+        else:
+            values[key] = _INLINE_COMMENT.sub("", bare).rstrip()
+    return values
+
 
 def load_env_file():
-    """Load environment variables from .env file if it exists."""
+    """
+    Load environment variables from .env file if it exists.
+
+    Variables already set in the environment (e.g. by Docker or systemd)
+    take precedence over the file.
+    """
     # Try multiple locations for .env file
     possible_locations = [
         Path.cwd() / ".env",  # Current working directory
@@ -28,40 +93,63 @@ def load_env_file():
     ]
 
     for env_file in possible_locations:
-        if env_file.exists():
-            print(f"Loading environment from {env_file}")
-            with open(env_file) as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip empty lines and comments
-                    if not line or line.startswith('#'):
-                        continue
-
-                    # Parse key=value
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip()
-
-                        # Remove inline comments (everything after #)
-                        if '#' in value:
-                            value = value.split('#')[0].strip()
-
-                        # Only set if not already in environment and value is not empty
-                        if key and value and key not in os.environ:
-                            os.environ[key] = value
-            return True
+        # A single open per candidate; a missing file just moves on to the next
+        try:
+            data = env_file.read_bytes()
+        except FileNotFoundError:
+            continue
+
+        print(f"Loading environment from {env_file}")
+        text = data.decode("utf-8")
+        try:
+            from dotenv import dotenv_values
+            parsed = dotenv_values(stream=io.StringIO(text))
+        except ImportError:
+            parsed = _parse_env(text)
+
+        # Only set if not already in environment and value is not empty
+        for key, value in parsed.items():
+            if value:
+                os.environ.setdefault(key, value)
+        return True
 
     return False
 
 
+@functools.lru_cache(maxsize=4)
+def _get_engine(provider_config_items: tuple) -> SpeechToTextEngine:
+    """
+    Build a Whisper-backed engine, reusing it for identical provider configs.
+
+    Args:
+        provider_config_items: Provider config as a sorted tuple of (key, value)
+            pairs, so it can be used as a cache key
+
+    Returns:
+        SpeechToTextEngine shared by every caller with the same config
+    """
+    return SpeechToTextEngine(provider=WhisperProvider(dict(provider_config_items)))
+
+
+async def _serve(bot: TelegramSTTBot):
+    """Run the bot and report as soon as it is receiving updates."""
+    task = asyncio.create_task(bot.run_async())
+    ready = asyncio.create_task(bot.wait_ready())
+
+    # Stop waiting for readiness if the bot fails to start
+    await asyncio.wait({task, ready}, return_when=asyncio.FIRST_COMPLETED)
+    if ready.done():
+        print("Bot is ready")
+    else:
+        ready.cancel()
+
+    await task
+
+
 def run_bot():
     """Run the Telegram bot with configuration from .env file."""
     # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
+    _setup_logging()
 
     # Load configuration from environment variables (.env file)
     settings = load_config()
@@ -75,6 +163,7 @@ def run_bot():
     print(f"Provider: {settings.stt.provider}")
     print(f"Model: {settings.stt.whisper_model}")
     print(f"Device: {settings.stt.whisper_device}")
+    print(f"Backend: {settings.stt.whisper_backend}")
     print(f"Max file size: {settings.telegram.max_file_size_mb}MB")
     if settings.telegram.allowed_users:
         print(f"Allowed users: {settings.telegram.allowed_users}")
@@ -83,22 +172,28 @@ def run_bot():
     print("=" * 60)
     print()
 
-    # Create STT engine
-    provider = WhisperProvider({
+    # Create STT engine (shared with any other bot built from the same config)
+    provider_config = {
         "model": settings.stt.whisper_model,
         "device": settings.stt.whisper_device,
         "language": settings.stt.whisper_language,
-    })
-    engine = SpeechToTextEngine(provider=provider)
-
-    # Create and run bot
+        "backend": settings.stt.whisper_backend,
+        "vad_filter": settings.stt.whisper_vad_filter,
+        "batch_size": settings.stt.whisper_batch_size,
+        "silence_threshold": settings.stt.whisper_silence_threshold,
+        "temp_dir": str(settings.temp_dir),
+    }
+    engine = _get_engine(tuple(sorted(provider_config.items())))
+
+    # Create and run bot. It loads the model in the background once it is
+    # connected to Telegram, so startup is not blocked on it.
     bot = TelegramSTTBot(settings=settings, engine=engine)
 
     try:
         print("Starting Telegram bot...")
         print("Press Ctrl+C to stop")
         print()
-        bot.run()
+        asyncio.run(_serve(bot))
     except KeyboardInterrupt:
         print("\n\nBot stopped by user")
         bot.stop()
@@ -9,10 +9,17 @@ This script checks if the bot is running and responsive by:
 
 Usage:
     python scripts/health_check.py
+    python scripts/health_check.py --daemon
     
+With --daemon the script stays running and performs a health check for every
+connection to a Unix socket, answering "OK" or "FAIL". This avoids rebuilding
+the event loop and Telegram connection for each probe.
+
 Environment variables:
     TELEGRAM_BOT_TOKEN: Bot token for authentication
     HEALTH_CHECK_CHAT_ID: (Optional) Chat ID to send test messages to
+    HEALTH_CHECK_SOCKET: (Optional) Socket path for --daemon mode
+        (default: /tmp/televoica-health.sock)
 """
 
 import os
@@ -28,10 +35,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Default Unix socket path for --daemon mode
+DEFAULT_SOCKET_PATH = "/tmp/televoica-health.sock"
+
+# Bytes per gibibyte, used when reporting memory and disk usage
+GIB = 1 << 30
+
 
 class BotHealthChecker:
     """Health checker for Telegram bot."""
     
+    __slots__ = ("bot_token", "chat_id", "_bot", "_me")
+    
     def __init__(self, bot_token: str, chat_id: Optional[str] = None):
         """
         Initialize health checker.
@@ -42,8 +57,23 @@ class BotHealthChecker:
         """
         self.bot_token = bot_token
         self.chat_id = chat_id
-        self.bot = None
-        
+        self._bot = None
+        self._me = None
+
+    @property
+    def bot(self):
+        """
+        Telegram bot client, created on first access.
+
+        A single instance is shared by all checks so they reuse the same
+        HTTP connection pool instead of opening a new one per call.
+        """
+        if self._bot is None:
+            from telegram import Bot
+
+            self._bot = Bot(token=self.bot_token)
+        return self._bot
+
     async def check_bot_connection(self) -> bool:
         """
         Check if bot can connect to Telegram API.
@@ -52,10 +82,15 @@ class BotHealthChecker:
             True if connection successful, False otherwise
         """
         try:
-            from telegram import Bot
-            
-            self.bot = Bot(token=self.bot_token)
-            bot_info = await self.bot.get_me()
+            if self._me is None:
+                # initialize() opens the connection pool and calls get_me() once
+                await self.bot.initialize()
+                bot_info = self.bot.bot
+            else:
+                # Ask Telegram again on later probes, so a revoked token or an
+                # unreachable API is noticed; the other checks reuse the identity
+                bot_info = await self.bot.get_me()
+            self._me = bot_info
 
             logger.info(f"Bot connection successful")
             logger.info(f"   Bot username: @{bot_info.username}")
@@ -76,7 +111,7 @@ class BotHealthChecker:
             True if bot can receive updates, False otherwise
         """
         try:
-            if not self.bot:
+            if self._me is None:
                 logger.error("Bot not initialized")
                 return False
             
@@ -102,7 +137,7 @@ class BotHealthChecker:
             return True
 
         try:
-            if not self.bot:
+            if self._me is None:
                 logger.error("Bot not initialized")
                 return False
 
@@ -131,25 +166,33 @@ class BotHealthChecker:
         try:
             import psutil
             
-            # Check CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
-            logger.info(f"   CPU usage: {cpu_percent}%")
+            # Check CPU usage (sampled in a thread so the event loop keeps running)
+            cpu_percent = await asyncio.to_thread(psutil.cpu_percent, interval=1)
+            logger.info("   CPU usage: %s%%", cpu_percent)
             
             # Check memory usage
             memory = psutil.virtual_memory()
-            logger.info(f"   Memory usage: {memory.percent}% ({memory.used / 1024**3:.2f}GB / {memory.total / 1024**3:.2f}GB)")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "   Memory usage: %s%% (%.2fGB / %.2fGB)",
+                    memory.percent, memory.used / GIB, memory.total / GIB
+                )
             
             # Check disk usage
             disk = psutil.disk_usage('/')
-            logger.info(f"   Disk usage: {disk.percent}% ({disk.used / 1024**3:.2f}GB / {disk.total / 1024**3:.2f}GB)")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "   Disk usage: %s%% (%.2fGB / %.2fGB)",
+                    disk.percent, disk.used / GIB, disk.total / GIB
+                )
             
             # Warning thresholds
             if cpu_percent > 90:
-                logger.warning(f"High CPU usage: {cpu_percent}%")
+                logger.warning("High CPU usage: %s%%", cpu_percent)
             if memory.percent > 90:
-                logger.warning(f"High memory usage: {memory.percent}%")
+                logger.warning("High memory usage: %s%%", memory.percent)
             if disk.percent > 90:
-                logger.warning(f"High disk usage: {disk.percent}%")
+                logger.warning("High disk usage: %s%%", disk.percent)
 
             return True
 
@@ -171,23 +214,19 @@ class BotHealthChecker:
         logger.info("Starting Televoica Bot Health Check")
         logger.info("=" * 60)
         
-        checks = []
-        
-        # Check bot connection
+        # Check bot connection (must run first, the other checks use the bot)
         logger.info("\n1. Checking bot connection...")
-        checks.append(await self.check_bot_connection())
-        
-        # Check bot updates
-        logger.info("\n2. Checking bot updates...")
-        checks.append(await self.check_bot_updates())
-        
-        # Send test message
-        logger.info("\n3. Sending test message...")
-        checks.append(await self.send_test_message())
+        checks = [await self.check_bot_connection()]
         
-        # Check system resources
-        logger.info("\n4. Checking system resources...")
-        checks.append(await self.check_system_resources())
+        # The remaining checks are independent, run them concurrently
+        logger.info("\n2. Checking bot updates, test message and system resources...")
+        results = await asyncio.gather(
+            self.check_bot_updates(),
+            self.send_test_message(),
+            self.check_system_resources(),
+            return_exceptions=True,
+        )
+        checks.extend(result is True for result in results)
         
         # Summary
         logger.info("\n" + "=" * 60)
@@ -210,9 +249,60 @@ class BotHealthChecker:
     
     async def close(self):
         """Close bot connection."""
-        if self.bot:
-            # No explicit close needed for python-telegram-bot v20+
-            pass
+        if self._bot is not None:
+            await self._bot.shutdown()
+
+
+async def serve_forever(checker: BotHealthChecker, socket_path: str = DEFAULT_SOCKET_PATH):
+    """
+    Serve health checks over a Unix socket until cancelled.
+    
+    Every connection triggers one health check and receives "OK" or "FAIL".
+    The checker, and with it the Telegram connection, is reused across probes.
+    
+    Args:
+        checker: Health checker to run for each probe
+        socket_path: Path of the Unix socket to listen on
+    """
+    # Probes arriving together share the bot, so run them one at a time
+    lock = asyncio.Lock()
+    
+    async def handle_probe(reader, writer):
+        try:
+            async with lock:
+                success = await checker.run_health_check()
+        except Exception as e:
+            logger.error(f"Health check failed with exception: {e}", exc_info=True)
+            success = False
+        
+        # The prober may hang up before reading the answer
+        try:
+            writer.write(b"OK\n" if success else b"FAIL\n")
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+        except (ConnectionError, BrokenPipeError) as e:
+            logger.warning(f"Health probe disconnected early: {e}")
+    
+    # Remove a stale socket left behind by a previous run
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    
+    # Probes make Telegram API calls, so only the owner may connect
+    old_umask = os.umask(0o177)
+    try:
+        server = await asyncio.start_unix_server(handle_probe, path=socket_path)
+    finally:
+        os.umask(old_umask)
+    os.chmod(socket_path, 0o600)
+    logger.info(f"Serving health checks on {socket_path}")
+    
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
 
 
 async def main():
@@ -230,6 +320,11 @@ async def main():
     checker = BotHealthChecker(bot_token=bot_token, chat_id=chat_id)
     
     try:
+        # Long-running mode: answer probes over a Unix socket
+        if "--daemon" in sys.argv:
+            socket_path = os.getenv("HEALTH_CHECK_SOCKET", DEFAULT_SOCKET_PATH)
+            await serve_forever(checker, socket_path)
+        
         # Run health check
         success = await checker.run_health_check()
         
@@ -4,20 +4,41 @@ Televoica: A modular speech-to-text library with optional Telegram bot integrati
 This package provides:
 1. Core speech-to-text functionality (standalone library)
 2. Optional Telegram bot integration for voice message transcription
+
+Public names are resolved lazily (PEP 562), so ``import televoica`` does not
+import the provider modules until one of them is actually used.
 """
 
+import importlib
+
 __version__ = "0.1.0"
 __author__ = "Mahmoud-Emad"
 
-from televoica.core.engine import SpeechToTextEngine
-from televoica.core.providers import (
-    STTProvider,
-    WhisperProvider,
-)
+# Maps each public name to the module that defines it
+_LAZY_IMPORTS = {
+    "SpeechToTextEngine": "televoica.core.engine",
+    "STTProvider": "televoica.core.providers",
+    "WhisperProvider": "televoica.core.providers",
+}
 
-__all__ = [
+__all__ = (
     "SpeechToTextEngine",
     "STTProvider",
     "WhisperProvider",
-]
+)
+
+
+def __getattr__(name: str):
+    """Import public names on first access and cache them in the module namespace."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    """Include lazily imported names in ``dir(televoica)``."""
+    return sorted(set(globals()) | set(__all__))
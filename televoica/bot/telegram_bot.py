@@ -5,16 +5,161 @@ This module implements the Telegram bot that receives voice messages
 and uses the SpeechToTextEngine to transcribe them.
 """
 
+import functools
+import hashlib
+import importlib.util
 import logging
-from pathlib import Path
+import os
+import secrets
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 import asyncio
 
 from televoica.core.engine import SpeechToTextEngine
 from televoica.config.settings import Settings
 
+# python-telegram-bot is optional; the bot raises ImportError when started without it
+try:
+    from telegram.ext import Application, CommandHandler, MessageHandler, filters
+except ImportError:
+    Application = CommandHandler = MessageHandler = filters = None
+
 logger = logging.getLogger(__name__)
 
+# HTTP/2 needs the optional h2 package (python-telegram-bot[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Connections shared by all concurrent Telegram API calls
+CONNECTION_POOL_SIZE = 256
+
+# Seconds to wait for a free connection before giving up
+POOL_TIMEOUT = 30.0
+
+# Updates handled at once. PTB handles one at a time by default, which would
+# leave all but one transcription thread idle; updates beyond the thread
+# pool's size download their audio and wait for a free thread.
+CONCURRENT_UPDATES = 64
+
+# Seconds to wait for a transcription before sending a "processing" reply.
+# Results ready within this time are sent as a single message instead.
+FAST_REPLY_TIMEOUT = 0.4
+
+# Seconds between checks for the application to finish starting
+READY_POLL_INTERVAL = 0.05
+
+# Reply sent to users who are not on the allow-list
+DENY = "⛔ Sorry, you are not authorized to use this bot."
+
+# Reply to /start
+WELCOME = (
+    "👋 Welcome to Televoica Bot!\n\n"
+    "Send me a voice message or audio file, and I'll transcribe it for you.\n\n"
+    "Commands:\n"
+    "/start - Show this message\n"
+    "/help - Show help information\n"
+    "/info - Show bot information"
+)
+
+# Reply to /help, formatted once with the maximum file size
+HELP_TEMPLATE = (
+    "ℹ️ How to use this bot:\n\n"
+    "1. Send a voice message (record using Telegram's voice recorder)\n"
+    "2. Or send an audio file (MP3, OGG, WAV, etc.)\n"
+    "3. Wait for the transcription\n\n"
+    "Maximum file size: {max_mb} MB\n\n"
+    "The bot uses advanced speech recognition to provide accurate transcriptions."
+)
+
+# Reply to /info
+INFO_TEMPLATE = (
+    "🤖 Bot Information:\n\n"
+    "STT Provider: {provider}\n"
+    "Max File Size: {max_mb} MB\n"
+    "Version: 0.1.0"
+)
+
+# Audio format for common file extensions, so the hot path is one dict lookup
+_AUDIO_FORMATS = {
+    ".mp3": "mp3",
+    ".ogg": "ogg",
+    ".oga": "ogg",
+    ".opus": "opus",
+    ".wav": "wav",
+    ".m4a": "m4a",
+    ".flac": "flac",
+}
+
+
+def _audio_format(file_name: Optional[str]) -> str:
+    """
+    Determine the audio format of an uploaded file from its name.
+
+    Args:
+        file_name: Original file name, if Telegram provided one
+
+    Returns:
+        Format name without the leading dot (defaults to 'mp3')
+    """
+    if not file_name:
+        return "mp3"
+    
+    extension = os.path.splitext(file_name)[1].lower()
+    return _AUDIO_FORMATS.get(extension) or extension[1:] or "mp3"
+
+
+# Fire-and-forget tasks, referenced until done so they are not garbage collected
+_background_tasks: set = set()
+
+
+def _on_background_done(task: asyncio.Task):
+    """Forget a finished background task and log its failure, if any."""
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Background reply failed: {task.exception()}", exc_info=task.exception())
+
+
+def _fire(coro) -> asyncio.Task:
+    """
+    Run a coroutine (typically a reply) without waiting for it.
+
+    Lets handlers return immediately instead of holding the update until
+    Telegram acknowledges the reply. Failures are logged.
+    """
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_done)
+    return task
+
+
+def _install_uvloop():
+    """
+    Use the libuv-based event loop when available.
+
+    It is a drop-in replacement with cheaper socket polling and I/O.
+    """
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        pass
+
+
+def _auth(handler):
+    """
+    Reject updates from users who are not allowed to use the bot.
+
+    Wraps a handler so the allow-list check happens once, before the handler runs.
+    """
+    @functools.wraps(handler)
+    async def wrapper(self, update, context):
+        if not self._is_user_allowed(update.message.from_user.id):
+            _fire(update.message.reply_text(DENY))
+            return
+        return await handler(self, update, context)
+    
+    return wrapper
+
 
 class TelegramSTTBot:
     """
@@ -35,223 +180,259 @@ class TelegramSTTBot:
         self.settings = settings
         self.engine = engine or SpeechToTextEngine()
         self.bot_token = settings.telegram.bot_token
-        self.allowed_users = set(settings.telegram.allowed_users)
-        self.max_file_size = settings.telegram.max_file_size_mb * 1024 * 1024  # Convert to bytes
+        self.allowed_users = frozenset(settings.telegram.allowed_users)
+        
+        # Check if a user is allowed to use the bot: everyone when no
+        # restrictions are set, otherwise a direct frozenset membership test
+        self._is_user_allowed = (
+            self.allowed_users.__contains__ if self.allowed_users else lambda user_id: True
+        )
+        self._max_mb = settings.telegram.max_file_size_mb
+        self.max_file_size = self._max_mb * 1024 * 1024  # Convert to bytes
         
-        # Will be initialized in run()
+        # Reply texts that only depend on settings are built once
+        self._help_text = HELP_TEMPLATE.format(max_mb=self._max_mb)
+        self._too_large_text = f"⚠️ File too large. Maximum size is {self._max_mb} MB."
+        
+        # Transcription is blocking, so it runs in a dedicated thread pool.
+        # A GPU model is shared by all requests, so CUDA runs one at a time.
+        device = getattr(self.engine.provider, "device", "cpu")
+        max_workers = 1 if device.startswith("cuda") else settings.stt.max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="televoica-stt"
+        )
+        self._max_workers = max_workers
+        
+        # Will be initialized in run() / run_async()
         self.application = None
         
+        # Set once the bot is connected and receiving updates
+        self._ready = asyncio.Event()
+        self._stop_event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
         logger.info("TelegramSTTBot initialized")
 
-    def _is_user_allowed(self, user_id: int) -> bool:
-        """
-        Check if a user is allowed to use the bot.
-
-        Args:
-            user_id: Telegram user ID
-
-        Returns:
-            True if user is allowed (or if no restrictions are set)
-        """
-        if not self.allowed_users:
-            return True  # No restrictions
-        return user_id in self.allowed_users
-
+    @_auth
     async def start_command(self, update, context):
         """Handle /start command."""
-        try:
-            from telegram import Update
-            from telegram.ext import ContextTypes
-        except ImportError:
-            raise ImportError(
-                "python-telegram-bot is not installed. "
-                "Install it with: pip install python-telegram-bot"
-            )
-        
-        user_id = update.effective_user.id
-        
-        if not self._is_user_allowed(user_id):
-            await update.message.reply_text(
-                "⛔ Sorry, you are not authorized to use this bot."
-            )
-            return
-        
-        welcome_message = (
-            "👋 Welcome to Televoica Bot!\n\n"
-            "Send me a voice message or audio file, and I'll transcribe it for you.\n\n"
-            "Commands:\n"
-            "/start - Show this message\n"
-            "/help - Show help information\n"
-            "/info - Show bot information"
-        )
-        
-        await update.message.reply_text(welcome_message)
+        await update.message.reply_text(WELCOME)
 
+    @_auth
     async def help_command(self, update, context):
         """Handle /help command."""
-        user_id = update.effective_user.id
-        
-        if not self._is_user_allowed(user_id):
-            await update.message.reply_text(
-                "⛔ Sorry, you are not authorized to use this bot."
-            )
-            return
-        
-        help_message = (
-            "ℹ️ How to use this bot:\n\n"
-            "1. Send a voice message (record using Telegram's voice recorder)\n"
-            "2. Or send an audio file (MP3, OGG, WAV, etc.)\n"
-            "3. Wait for the transcription\n\n"
-            f"Maximum file size: {self.settings.telegram.max_file_size_mb} MB\n\n"
-            "The bot uses advanced speech recognition to provide accurate transcriptions."
-        )
-        
-        await update.message.reply_text(help_message)
+        await update.message.reply_text(self._help_text)
 
+    @_auth
     async def info_command(self, update, context):
         """Handle /info command."""
-        user_id = update.effective_user.id
-        
-        if not self._is_user_allowed(user_id):
-            await update.message.reply_text(
-                "⛔ Sorry, you are not authorized to use this bot."
+        # Formatted per call: the engine's provider can be swapped at runtime
+        await update.message.reply_text(
+            INFO_TEMPLATE.format(
+                provider=self.engine.provider.__class__.__name__, max_mb=self._max_mb
             )
-            return
-        
-        provider_name = self.engine.provider.__class__.__name__
-        info_message = (
-            f"🤖 Bot Information:\n\n"
-            f"STT Provider: {provider_name}\n"
-            f"Max File Size: {self.settings.telegram.max_file_size_mb} MB\n"
-            f"Version: 0.1.0"
         )
-        
-        await update.message.reply_text(info_message)
 
+    async def _fetch(self, file) -> bytes:
+        """
+        Download a Telegram file into memory.
+
+        The download reuses the bot's pooled HTTP connection. The contents are
+        returned as ``bytes``, since not every provider accepts a ``bytearray``
+        (protobuf fields used by Google Cloud STT do not).
+
+        Args:
+            file: Telegram File object returned by ``bot.get_file``
+
+        Returns:
+            File contents
+        """
+        return bytes(await file.download_as_bytearray())
+
+    async def _transcribe(self, audio_bytes: bytes, audio_format: str) -> str:
+        """
+        Transcribe audio on the thread pool without blocking the event loop.
+
+        Args:
+            audio_bytes: Audio data
+            audio_format: Audio format (e.g., 'ogg', 'mp3')
+
+        Returns:
+            Transcribed text
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self.engine.transcribe_bytes, audio_bytes, audio_format
+        )
+
+    @_auth
     async def handle_voice(self, update, context):
         """Handle voice messages."""
-        user_id = update.effective_user.id
-        
-        if not self._is_user_allowed(user_id):
-            await update.message.reply_text(
-                "⛔ Sorry, you are not authorized to use this bot."
-            )
-            return
-        
         voice = update.message.voice
         
         # Check file size
         if voice.file_size > self.max_file_size:
-            await update.message.reply_text(
-                f"⚠️ File too large. Maximum size is {self.settings.telegram.max_file_size_mb} MB."
-            )
+            _fire(update.message.reply_text(self._too_large_text))
             return
         
-        # Send processing message
-        processing_msg = await update.message.reply_text("🎙️ Processing your voice message...")
-        
-        try:
-            # Download voice file
-            file = await context.bot.get_file(voice.file_id)
-            file_path = self.settings.temp_dir / f"{voice.file_id}.ogg"
-            await file.download_to_drive(file_path)
-            
-            logger.info(f"Downloaded voice message from user {user_id}: {file_path}")
-            
-            # Transcribe
-            text = self.engine.transcribe_file(file_path)
-            
-            # Clean up
-            file_path.unlink(missing_ok=True)
-            
-            # Send result
-            if text:
-                await processing_msg.edit_text(f"📝 Transcription:\n\n{text}")
-                logger.info(f"Transcription sent to user {user_id}")
-            else:
-                await processing_msg.edit_text("⚠️ No speech detected in the audio.")
-        
-        except Exception as e:
-            logger.error(f"Error processing voice message: {e}", exc_info=True)
-            await processing_msg.edit_text(
-                f"❌ Error processing voice message: {str(e)}"
-            )
+        await self._transcribe_and_reply(
+            update, context, voice.file_id, "ogg",
+            kind="voice message", processing_text="🎙️ Processing your voice message...",
+        )
 
+    @_auth
     async def handle_audio(self, update, context):
         """Handle audio files."""
-        user_id = update.effective_user.id
-        
-        if not self._is_user_allowed(user_id):
-            await update.message.reply_text(
-                "⛔ Sorry, you are not authorized to use this bot."
-            )
-            return
-        
         audio = update.message.audio
         
         # Check file size
         if audio.file_size > self.max_file_size:
-            await update.message.reply_text(
-                f"⚠️ File too large. Maximum size is {self.settings.telegram.max_file_size_mb} MB."
-            )
+            _fire(update.message.reply_text(self._too_large_text))
             return
         
-        # Send processing message
-        processing_msg = await update.message.reply_text("🎵 Processing your audio file...")
+        # Determine audio format from the file extension
+        await self._transcribe_and_reply(
+            update, context, audio.file_id, _audio_format(audio.file_name),
+            kind="audio file", processing_text="🎵 Processing your audio file...",
+        )
+
+    async def _transcribe_and_reply(
+        self, update, context, file_id: str, audio_format: str, kind: str, processing_text: str
+    ):
+        """
+        Download an audio message, transcribe it and reply with the text.
+
+        Short clips are often done before a "processing" reply would even
+        arrive, so that reply is only sent if the result takes longer than
+        FAST_REPLY_TIMEOUT; the final text then replaces it.
+
+        Args:
+            update: Telegram update being answered
+            context: Handler context
+            file_id: Telegram file ID of the audio
+            audio_format: Audio format (e.g., 'ogg', 'mp3')
+            kind: What was sent, for logs and error replies (e.g., 'voice message')
+            processing_text: Reply sent while a slow transcription is running
+        """
+        user_id = update.message.from_user.id
+        
+        # Only sent when the transcription is not ready within FAST_REPLY_TIMEOUT
+        processing_msg = None
         
         try:
-            # Download audio file
-            file = await context.bot.get_file(audio.file_id)
-            
-            # Determine file extension
-            file_ext = Path(audio.file_name).suffix if audio.file_name else ".mp3"
-            file_path = self.settings.temp_dir / f"{audio.file_id}{file_ext}"
-            
-            await file.download_to_drive(file_path)
+            # Download into memory
+            file = await context.bot.get_file(file_id)
+            audio_bytes = await self._fetch(file)
             
-            logger.info(f"Downloaded audio file from user {user_id}: {file_path}")
+            logger.info(f"Downloaded {kind} from user {user_id}: {len(audio_bytes)} bytes")
             
-            # Transcribe
-            text = self.engine.transcribe_file(file_path)
-            
-            # Clean up
-            file_path.unlink(missing_ok=True)
+            # Transcribe without blocking the event loop
+            task = asyncio.ensure_future(self._transcribe(audio_bytes, audio_format))
+            try:
+                text = await asyncio.wait_for(asyncio.shield(task), FAST_REPLY_TIMEOUT)
+            except asyncio.TimeoutError:
+                processing_msg = await update.message.reply_text(processing_text)
+                text = await task
+            finally:
+                # Do not leave the transcription running if the reply failed
+                task.cancel()
             
             # Send result
             if text:
-                await processing_msg.edit_text(f"📝 Transcription:\n\n{text}")
+                await self._respond(update, processing_msg, f"📝 Transcription:\n\n{text}")
                 logger.info(f"Transcription sent to user {user_id}")
             else:
-                await processing_msg.edit_text("⚠️ No speech detected in the audio.")
+                await self._respond(update, processing_msg, "⚠️ No speech detected in the audio.")
         
         except Exception as e:
-            logger.error(f"Error processing audio file: {e}", exc_info=True)
-            await processing_msg.edit_text(
-                f"❌ Error processing audio file: {str(e)}"
-            )
+            logger.error(f"Error processing {kind}: {e}", exc_info=True)
+            await self._respond(update, processing_msg, f"❌ Error processing {kind}: {str(e)}")
+
+    async def _respond(self, update, processing_msg, text: str):
+        """
+        Send the final reply to a voice message or audio file.
+
+        Args:
+            update: Telegram update being answered
+            processing_msg: "Processing" message to edit, or None to reply directly
+            text: Reply text
+        """
+        if processing_msg is None:
+            await update.message.reply_text(text)
+        else:
+            await processing_msg.edit_text(text)
 
     async def error_handler(self, update, context):
         """Handle errors."""
         logger.error(f"Update {update} caused error {context.error}", exc_info=context.error)
 
-    def run(self):
+    def _warmup(self):
         """
-        Start the Telegram bot.
-        
-        This method blocks until the bot is stopped.
+        Load the STT provider's model or client so the first user does not wait for it.
+
+        Failures are logged and ignored; the first real request then loads the model.
         """
         try:
-            from telegram.ext import Application, CommandHandler, MessageHandler, filters
-        except ImportError:
+            logger.info("Warming up STT provider...")
+            self.engine.provider.preload()
+            logger.info("STT provider warmed up")
+        except Exception as e:
+            logger.warning(f"STT provider warm-up failed: {e}")
+
+    def _start_warmup(self):
+        """
+        Warm up the STT provider on the thread pool without delaying startup.
+
+        Requests that arrive before it finishes wait for the same model load
+        instead of starting another one.
+        """
+        asyncio.get_running_loop().run_in_executor(self._executor, self._warmup)
+
+    async def _on_startup(self, application):
+        """Start warming up the STT provider and watch for the bot becoming ready."""
+        self._loop = asyncio.get_running_loop()
+        self._start_warmup()
+        # post_init runs before updates are fetched, so readiness is set later
+        _fire(self._set_ready_when_running(application))
+
+    async def _set_ready_when_running(self, application):
+        """Mark the bot as ready once the application and its updater are running."""
+        while not (
+            application.running
+            and (application.updater is None or application.updater.running)
+        ):
+            await asyncio.sleep(READY_POLL_INTERVAL)
+        self._ready.set()
+
+    async def _on_shutdown(self, application):
+        """Release the transcription threads once the application has stopped."""
+        self._ready.clear()
+        self._executor.shutdown(wait=False)
+
+    def _build_application(self):
+        """Create the Telegram application and register all handlers."""
+        if Application is None:
             raise ImportError(
                 "python-telegram-bot is not installed. "
                 "Install it with: pip install python-telegram-bot"
             )
         
-        logger.info("Starting Telegram bot...")
+        # Create application. Each message needs a download and two API calls,
+        # so the pool is sized for bursts and waits instead of failing when full.
+        builder = (
+            Application.builder()
+            .token(self.bot_token)
+            .post_init(self._on_startup)
+            .post_shutdown(self._on_shutdown)
+            .concurrent_updates(max(CONCURRENT_UPDATES, self._max_workers))
+            .connection_pool_size(CONNECTION_POOL_SIZE)
+            .pool_timeout(POOL_TIMEOUT)
+        )
         
-        # Create application
-        self.application = Application.builder().token(self.bot_token).build()
+        # HTTP/2 multiplexes concurrent API calls over one TLS connection
+        if _HTTP2_AVAILABLE:
+            builder = builder.http_version("2").get_updates_http_version("2")
+        
+        self.application = builder.build()
         
         # Add handlers
         self.application.add_handler(CommandHandler("start", self.start_command))
@@ -262,14 +443,135 @@ class TelegramSTTBot:
         
         # Add error handler
         self.application.add_error_handler(self.error_handler)
+
+    def run(self):
+        """
+        Start the Telegram bot.
+        
+        This method blocks until the bot is stopped.
+        """
+        logger.info("Starting Telegram bot...")
+        
+        _install_uvloop()
+        
+        self._build_application()
         
         # Start bot
         logger.info("Bot is running. Press Ctrl+C to stop.")
         self.application.run_polling(allowed_updates=["message"])
 
+    def run_webhook(
+        self,
+        webhook_url: str,
+        listen: str = "0.0.0.0",
+        port: int = 8443,
+        url_path: Optional[str] = None,
+        cert: Optional[str] = None,
+        key: Optional[str] = None,
+        secret_token: Optional[str] = None,
+        drop_pending_updates: bool = False,
+    ):
+        """
+        Start the Telegram bot in webhook mode.
+
+        Telegram pushes updates to the bot instead of the bot polling for
+        them. This method blocks until the bot is stopped.
+
+        Args:
+            webhook_url: Public HTTPS URL Telegram sends updates to, without url_path
+            listen: Address the webhook server binds to
+            port: Port the webhook server listens on (Telegram allows 443, 80, 88, 8443)
+            url_path: Path the updates are posted to (default: derived from a hash
+                of the bot token, so the token itself never appears in URLs or logs)
+            cert: Optional path to the SSL certificate, for self-signed setups
+            key: Optional path to the SSL private key, for self-signed setups
+            secret_token: Value Telegram sends in the X-Telegram-Bot-Api-Secret-Token
+                header; requests without it are rejected (default: random per start)
+            drop_pending_updates: Discard updates that arrived while the bot was down
+        """
+        logger.info("Starting Telegram bot in webhook mode...")
+
+        _install_uvloop()
+
+        self._build_application()
+
+        url_path = url_path or self._default_url_path()
+        secret_token = secret_token or secrets.token_urlsafe(32)
+
+        logger.info(
+            f"Bot is listening for updates on {listen}:{port}/{url_path}. Press Ctrl+C to stop."
+        )
+        self.application.run_webhook(
+            listen=listen,
+            port=port,
+            url_path=url_path,
+            webhook_url=f"{webhook_url.rstrip('/')}/{url_path}",
+            cert=cert,
+            key=key,
+            secret_token=secret_token,
+            allowed_updates=["message"],
+            drop_pending_updates=drop_pending_updates,
+        )
+
+    def _default_url_path(self) -> str:
+        """Derive a stable webhook path from the bot token without revealing it."""
+        return hashlib.sha256(f"televoica-webhook:{self.bot_token}".encode()).hexdigest()[:32]
+
+    async def run_async(self):
+        """
+        Start the Telegram bot inside an already running event loop.
+        
+        Returns once stop() is called or the task is cancelled. Use
+        wait_ready() to find out when the bot is receiving updates.
+        """
+        logger.info("Starting Telegram bot...")
+        self._build_application()
+        self._stop_event = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        
+        async with self.application:
+            await self.application.start()
+            await self.application.updater.start_polling(allowed_updates=["message"])
+            self._start_warmup()
+            self._ready.set()
+            logger.info("Bot is running.")
+            
+            try:
+                await self._stop_event.wait()
+            finally:
+                self._ready.clear()
+                await self.application.updater.stop()
+                await self.application.stop()
+                # Handlers are done, so no transcription is waiting on the threads
+                self._executor.shutdown(wait=False)
+
+    async def wait_ready(self, timeout: Optional[float] = None):
+        """
+        Wait until the bot is connected and receiving updates.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait forever
+
+        Raises:
+            asyncio.TimeoutError: If the bot is not ready within the timeout
+        """
+        await asyncio.wait_for(self._ready.wait(), timeout)
+
     def stop(self):
-        """Stop the Telegram bot."""
-        if self.application:
-            logger.info("Stopping Telegram bot...")
-            self.application.stop()
+        """
+        Stop the Telegram bot.
 
+        Safe to call from any thread. The stop is scheduled on the bot's
+        event loop; updates being handled are finished before the bot shuts
+        down and releases its transcription threads.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        
+        logger.info("Stopping Telegram bot...")
+        if self._stop_event is not None:
+            loop.call_soon_threadsafe(self._stop_event.set)
+        elif self.application is not None:
+            # Makes run() / run_webhook() return after a clean shutdown
+            loop.call_soon_threadsafe(self.application.stop_running)
@@ -39,6 +39,7 @@ def transcribe_command(args):
             "model": args.whisper_model,
             "device": args.device,
             "language": args.language,
+            "backend": args.whisper_backend,
         })
     elif args.provider == "google_cloud":
         provider = GoogleCloudSTTProvider({
@@ -97,6 +98,8 @@ def bot_command(args):
         settings.stt.whisper_model = args.whisper_model
     if args.device:
         settings.stt.whisper_device = args.device
+    if args.whisper_backend:
+        settings.stt.whisper_backend = args.whisper_backend
     
     # Enable Telegram bot mode
     settings.telegram_bot = True
@@ -107,18 +110,25 @@ def bot_command(args):
             "model": settings.stt.whisper_model,
             "device": settings.stt.whisper_device,
             "language": settings.stt.whisper_language,
+            "backend": settings.stt.whisper_backend,
+            "vad_filter": settings.stt.whisper_vad_filter,
+            "batch_size": settings.stt.whisper_batch_size,
+            "silence_threshold": settings.stt.whisper_silence_threshold,
+            "temp_dir": settings.temp_dir,
+            "preload": settings.stt.preload_models,
         })
     elif settings.stt.provider == "google_cloud":
         provider = GoogleCloudSTTProvider({
             "credentials_path": settings.stt.google_credentials_path,
             "language_code": settings.stt.google_language_code,
+            "preload": settings.stt.preload_models,
         })
     else:
         logger.error(f"Unknown provider: {settings.stt.provider}")
         sys.exit(1)
     
     # Create engine
-    engine = SpeechToTextEngine(provider=provider)
+    engine = SpeechToTextEngine(provider=provider, cache_size=settings.stt.cache_size)
     
     # Create and run bot
     from televoica.bot.telegram_bot import TelegramSTTBot
@@ -126,7 +136,14 @@ def bot_command(args):
     bot = TelegramSTTBot(settings=settings, engine=engine)
     
     try:
-        bot.run()
+        if args.webhook_url:
+            bot.run_webhook(
+                webhook_url=args.webhook_url,
+                listen=args.webhook_listen,
+                port=args.webhook_port,
+            )
+        else:
+            bot.run()
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
         bot.stop()
@@ -153,6 +170,9 @@ Examples:
   
   # Run bot with custom configuration
   televoica bot --config config.yaml --provider whisper --whisper-model small
+  
+  # Run bot behind a reverse proxy, receiving updates via webhook
+  televoica bot --webhook-url https://bot.example.com --webhook-port 8443
         """
     )
     
@@ -190,6 +210,12 @@ Examples:
         default="base",
         help="Whisper model size (default: base)"
     )
+    transcribe_parser.add_argument(
+        "--whisper-backend",
+        choices=["openai", "faster_whisper", "whisper_cpp"],
+        default="openai",
+        help="Whisper implementation (default: openai)"
+    )
     transcribe_parser.add_argument(
         "--device",
         choices=["cpu", "cuda"],
@@ -225,11 +251,31 @@ Examples:
         choices=["tiny", "base", "small", "medium", "large"],
         help="Whisper model size (overrides config file)"
     )
+    bot_parser.add_argument(
+        "--whisper-backend",
+        choices=["openai", "faster_whisper", "whisper_cpp"],
+        help="Whisper implementation (overrides config file)"
+    )
     bot_parser.add_argument(
         "--device",
         choices=["cpu", "cuda"],
         help="Device to run on (overrides config file)"
     )
+    bot_parser.add_argument(
+        "--webhook-url",
+        help="Public HTTPS URL to receive updates on via webhook (default: long polling)"
+    )
+    bot_parser.add_argument(
+        "--webhook-listen",
+        default="0.0.0.0",
+        help="Address the webhook server binds to (default: 0.0.0.0)"
+    )
+    bot_parser.add_argument(
+        "--webhook-port",
+        type=int,
+        default=8443,
+        help="Port the webhook server listens on (default: 8443)"
+    )
     bot_parser.set_defaults(func=bot_command)
     
     # Parse arguments
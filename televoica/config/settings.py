@@ -5,16 +5,57 @@ This module handles loading configuration from environment variables,
 config files, and provides default settings.
 """
 
+import functools
 import os
 from pathlib import Path
-from typing import Optional, Dict, Any, Literal
+from typing import Optional, Dict, Any, Callable, Literal, Tuple
 from dataclasses import dataclass, field
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Default scratch directory for downloaded and temporary audio files
+DEFAULT_TEMP_DIR = Path("/tmp/televoica")
 
-@dataclass
+# RAM-backed scratch directory used instead of the default when ram_temp_dir
+# is enabled and /tmp is on a real disk
+SHM_TEMP_DIR = Path("/dev/shm/televoica")
+
+# Filesystem types that keep their files in memory
+_RAM_FILESYSTEMS = {"tmpfs", "ramfs"}
+
+
+@functools.lru_cache(maxsize=None)
+def _is_ram_backed(path: Path) -> bool:
+    """
+    Check whether a path lives on a RAM-backed filesystem such as tmpfs.
+
+    Looks up the closest mount point in /proc/mounts, so it only detects
+    RAM-backed filesystems on Linux; elsewhere it returns False. Results are
+    cached, so /proc/mounts is read once per path.
+    """
+    try:
+        mounts = Path("/proc/mounts").read_text()
+    except OSError:
+        return False
+    
+    target = str(path.resolve())
+    mount_point, fs_type = "", ""
+    for line in mounts.splitlines():
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        
+        candidate = fields[1]
+        if target != candidate and not target.startswith(candidate.rstrip("/") + "/"):
+            continue
+        if len(candidate) > len(mount_point):
+            mount_point, fs_type = candidate, fields[2]
+    
+    return fs_type in _RAM_FILESYSTEMS
+
+
+@dataclass(slots=True)
 class STTConfig:
     """Configuration for speech-to-text provider."""
     
@@ -24,13 +65,35 @@ class STTConfig:
     whisper_model: str = "base"
     whisper_device: str = "cpu"
     whisper_language: Optional[str] = None
+    whisper_backend: Literal["openai", "faster_whisper", "whisper_cpp"] = "openai"
+    
+    # Skip silence with voice activity detection before decoding (faster_whisper
+    # only); None keeps the backend's default
+    whisper_vad_filter: Optional[bool] = None
+    
+    # Number of 30-second windows of a clip faster-whisper decodes together
+    # (1 decodes sequentially)
+    whisper_batch_size: int = 1
+    
+    # RMS level below which decoded audio is answered as silence without
+    # running the model (0 disables, 0.01 is about -40 dBFS)
+    whisper_silence_threshold: float = 0.0
     
     # Google Cloud-specific settings
     google_credentials_path: Optional[str] = None
     google_language_code: str = "en-US"
+    
+    # Load the model when the provider is created instead of on the first request
+    preload_models: bool = False
+    
+    # Number of transcriptions the bot runs in parallel
+    max_workers: int = 2
+    
+    # Number of transcriptions kept in memory for repeated audio (0 disables)
+    cache_size: int = 512
 
 
-@dataclass
+@dataclass(slots=True)
 class TelegramConfig:
     """Configuration for Telegram bot."""
     
@@ -40,7 +103,7 @@ class TelegramConfig:
     max_file_size_mb: int = 20
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     """Main application settings."""
     
@@ -57,12 +120,27 @@ class Settings:
     log_level: str = "INFO"
     
     # Storage
-    temp_dir: Path = field(default_factory=lambda: Path("/tmp/televoica"))
+    temp_dir: Path = field(default_factory=lambda: DEFAULT_TEMP_DIR)
+    
+    # Keep scratch files in /dev/shm when the default temp_dir is on disk.
+    # Off by default: /dev/shm is small in containers (64 MB under Docker).
+    ram_temp_dir: bool = False
 
     def __post_init__(self):
         """Validate and process settings after initialization."""
-        # Ensure temp directory exists
+        # Keep scratch files in memory if asked to: when the default /tmp is
+        # on disk, use /dev/shm instead if it is available
         self.temp_dir = Path(self.temp_dir)
+        if (
+            self.ram_temp_dir
+            and self.temp_dir == DEFAULT_TEMP_DIR
+            and not _is_ram_backed(self.temp_dir)
+            and _is_ram_backed(SHM_TEMP_DIR.parent)
+        ):
+            logger.info(f"{DEFAULT_TEMP_DIR.parent} is not RAM-backed, using {SHM_TEMP_DIR}")
+            self.temp_dir = SHM_TEMP_DIR
+        
+        # Ensure temp directory exists
         self.temp_dir.mkdir(parents=True, exist_ok=True)
         
         # If telegram_bot mode is enabled, ensure telegram is also enabled
@@ -98,6 +176,13 @@ def load_config(
         STT_WHISPER_MODEL: Whisper model size (tiny, base, small, medium, large)
         STT_WHISPER_DEVICE: Device to run Whisper on (cpu, cuda)
         STT_WHISPER_LANGUAGE: Language code for Whisper
+        STT_WHISPER_BACKEND: Whisper implementation (openai, faster_whisper, whisper_cpp)
+        STT_WHISPER_VAD_FILTER: Skip silence before decoding, faster_whisper only (true/false)
+        STT_WHISPER_BATCH_SIZE: Audio windows faster_whisper decodes together (1 disables)
+        STT_WHISPER_SILENCE_THRESHOLD: Skip audio quieter than this RMS level (0 disables)
+        STT_PRELOAD_MODELS: Load the model at startup instead of on first use (true/false)
+        STT_MAX_WORKERS: Number of transcriptions the bot runs in parallel
+        STT_CACHE_SIZE: Number of transcriptions cached for repeated audio (0 disables)
         TELEGRAM_BOT_TOKEN: Telegram bot token
         TELEGRAM_ALLOWED_USERS: Comma-separated list of allowed user IDs
     """
@@ -116,14 +201,22 @@ def load_config(
     settings = Settings(
         telegram_bot=config_dict.get("telegram_bot", False),
         log_level=config_dict.get("log_level", "INFO"),
-        temp_dir=Path(config_dict.get("temp_dir", "/tmp/televoica")),
+        temp_dir=Path(config_dict.get("temp_dir", DEFAULT_TEMP_DIR)),
+        ram_temp_dir=config_dict.get("ram_temp_dir", False),
         stt=STTConfig(
             provider=config_dict.get("stt_provider", "whisper"),
             whisper_model=config_dict.get("whisper_model", "base"),
             whisper_device=config_dict.get("whisper_device", "cpu"),
             whisper_language=config_dict.get("whisper_language"),
+            whisper_backend=config_dict.get("whisper_backend", "openai"),
+            whisper_vad_filter=config_dict.get("whisper_vad_filter"),
+            whisper_batch_size=config_dict.get("whisper_batch_size", 1),
+            whisper_silence_threshold=config_dict.get("whisper_silence_threshold", 0.0),
             google_credentials_path=config_dict.get("google_credentials_path"),
             google_language_code=config_dict.get("google_language_code", "en-US"),
+            preload_models=config_dict.get("preload_models", False),
+            max_workers=config_dict.get("max_workers", 2),
+            cache_size=config_dict.get("cache_size", 512),
         ),
         telegram=TelegramConfig(
             enabled=config_dict.get("telegram_bot", False),
@@ -139,72 +232,90 @@ def load_config(
 
 def _load_config_file(config_file: Path) -> Dict[str, Any]:
     """Load configuration from YAML or JSON file."""
-    import json
-    
     suffix = config_file.suffix.lower()
     
     if suffix == ".json":
-        with open(config_file) as f:
-            return json.load(f)
+        # orjson parses bytes directly and is several times faster than json
+        try:
+            import orjson
+            return orjson.loads(config_file.read_bytes())
+        except ImportError:
+            import json
+            return json.loads(config_file.read_bytes())
     elif suffix in [".yaml", ".yml"]:
         try:
             import yaml
-            with open(config_file) as f:
-                return yaml.safe_load(f) or {}
         except ImportError:
             raise ImportError(
                 "PyYAML is not installed. Install it with: pip install pyyaml"
             )
+        
+        # Prefer the libyaml-based C loader, it is much faster than the pure-Python one
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        return yaml.load(config_file.read_bytes(), Loader=loader) or {}
     else:
         raise ValueError(f"Unsupported config file format: {suffix}")
 
 
-def _load_from_env(prefix: str = "STT_") -> Dict[str, Any]:
-    """Load configuration from environment variables."""
-    config = {}
-    
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable."""
+    return value.lower() in ["true", "1", "yes"]
+
+
+def _parse_user_ids(value: str) -> list[int]:
+    """Parse a comma-separated list of Telegram user IDs."""
+    return [int(uid.strip()) for uid in value.split(",") if uid.strip()]
+
+
+# Environment variable suffix (after the prefix) -> (config key, parser)
+_PREFIXED_ENV_VARS: Dict[str, Tuple[str, Callable[[str], Any]]] = {
     # Telegram bot mode
-    if os.getenv(f"{prefix}TELEGRAM_BOT"):
-        config["telegram_bot"] = os.getenv(f"{prefix}TELEGRAM_BOT", "").lower() in ["true", "1", "yes"]
-    
+    "TELEGRAM_BOT": ("telegram_bot", _parse_bool),
     # Logging
-    if os.getenv(f"{prefix}LOG_LEVEL"):
-        config["log_level"] = os.getenv(f"{prefix}LOG_LEVEL", "INFO")
-    
+    "LOG_LEVEL": ("log_level", str),
     # STT provider
-    if os.getenv(f"{prefix}PROVIDER"):
-        config["stt_provider"] = os.getenv(f"{prefix}PROVIDER", "whisper")
-    
+    "PROVIDER": ("stt_provider", str),
     # Whisper settings
-    if os.getenv(f"{prefix}WHISPER_MODEL"):
-        config["whisper_model"] = os.getenv(f"{prefix}WHISPER_MODEL", "base")
-    if os.getenv(f"{prefix}WHISPER_DEVICE"):
-        config["whisper_device"] = os.getenv(f"{prefix}WHISPER_DEVICE", "cpu")
-    if os.getenv(f"{prefix}WHISPER_LANGUAGE"):
-        config["whisper_language"] = os.getenv(f"{prefix}WHISPER_LANGUAGE")
-    
+    "WHISPER_MODEL": ("whisper_model", str),
+    "WHISPER_DEVICE": ("whisper_device", str),
+    "WHISPER_LANGUAGE": ("whisper_language", str),
+    "WHISPER_BACKEND": ("whisper_backend", str),
+    "WHISPER_VAD_FILTER": ("whisper_vad_filter", _parse_bool),
+    "WHISPER_BATCH_SIZE": ("whisper_batch_size", int),
+    "WHISPER_SILENCE_THRESHOLD": ("whisper_silence_threshold", float),
     # Google Cloud settings
-    if os.getenv(f"{prefix}GOOGLE_CREDENTIALS_PATH"):
-        config["google_credentials_path"] = os.getenv(f"{prefix}GOOGLE_CREDENTIALS_PATH")
-    if os.getenv(f"{prefix}GOOGLE_LANGUAGE_CODE"):
-        config["google_language_code"] = os.getenv(f"{prefix}GOOGLE_LANGUAGE_CODE", "en-US")
-    
-    # Telegram settings
-    if os.getenv("TELEGRAM_BOT_TOKEN"):
-        config["telegram_bot_token"] = os.getenv("TELEGRAM_BOT_TOKEN")
-    
-    if os.getenv("TELEGRAM_ALLOWED_USERS"):
-        users_str = os.getenv("TELEGRAM_ALLOWED_USERS", "")
-        config["telegram_allowed_users"] = [
-            int(uid.strip()) for uid in users_str.split(",") if uid.strip()
-        ]
+    "GOOGLE_CREDENTIALS_PATH": ("google_credentials_path", str),
+    "GOOGLE_LANGUAGE_CODE": ("google_language_code", str),
+    # Model loading
+    "PRELOAD_MODELS": ("preload_models", _parse_bool),
+    # Concurrency
+    "MAX_WORKERS": ("max_workers", int),
+    "CACHE_SIZE": ("cache_size", int),
+    # Temp directory
+    "TEMP_DIR": ("temp_dir", str),
+    "RAM_TEMP_DIR": ("ram_temp_dir", _parse_bool),
+}
+
+# Unprefixed environment variable -> (config key, parser)
+_TELEGRAM_ENV_VARS: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    "TELEGRAM_BOT_TOKEN": ("telegram_bot_token", str),
+    "TELEGRAM_ALLOWED_USERS": ("telegram_allowed_users", _parse_user_ids),
+    "TELEGRAM_MAX_FILE_SIZE_MB": ("telegram_max_file_size_mb", int),
+}
+
+
+def _load_from_env(prefix: str = "STT_") -> Dict[str, Any]:
+    """Load configuration from environment variables."""
+    env = os.environ
+    config = {}
     
-    if os.getenv("TELEGRAM_MAX_FILE_SIZE_MB"):
-        config["telegram_max_file_size_mb"] = int(os.getenv("TELEGRAM_MAX_FILE_SIZE_MB", "20"))
+    # Each variable is looked up once; unset and empty variables are skipped
+    for suffix, (key, parse) in _PREFIXED_ENV_VARS.items():
+        if value := env.get(prefix + suffix):
+            config[key] = parse(value)
     
-    # Temp directory
-    if os.getenv(f"{prefix}TEMP_DIR"):
-        config["temp_dir"] = os.getenv(f"{prefix}TEMP_DIR", "/tmp/televoica")
+    for name, (key, parse) in _TELEGRAM_ENV_VARS.items():
+        if value := env.get(name):
+            config[key] = parse(value)
     
     return config
-
@@ -0,0 +1,58 @@
+"""
+Pool of reusable float32 buffers for decoded audio.
+
+Decoding a voice message needs a multi-megabyte sample buffer. Reusing
+buffers across requests avoids allocating (and page-faulting) a fresh one
+for every message.
+"""
+
+import queue
+
+import numpy as np
+
+# Whisper processes audio in 30-second windows of 16 kHz samples
+N_SAMPLES = 16000 * 30
+
+# Maximum number of idle buffers kept around (~1.9 MB each)
+MAX_POOLED = 8
+
+_POOL: "queue.LifoQueue[np.ndarray]" = queue.LifoQueue(maxsize=MAX_POOLED)
+
+
+def get(nsamples: int = N_SAMPLES) -> np.ndarray:
+    """
+    Get a float32 buffer, reusing a pooled one when possible.
+
+    Only buffers of the standard size are pooled; other sizes are allocated.
+
+    Args:
+        nsamples: Number of samples the buffer must hold
+
+    Returns:
+        Uninitialized 1-D float32 array of length ``nsamples``
+    """
+    if nsamples == N_SAMPLES:
+        try:
+            return _POOL.get_nowait()
+        except queue.Empty:
+            pass
+
+    return np.empty(nsamples, dtype=np.float32)
+
+
+def put(buf: np.ndarray):
+    """
+    Return a buffer obtained from get() to the pool.
+
+    The caller must not use the buffer, or any view of it, afterwards.
+
+    Args:
+        buf: Buffer to release
+    """
+    if buf.shape != (N_SAMPLES,):
+        return
+
+    try:
+        _POOL.put_nowait(buf)
+    except queue.Full:
+        pass
@@ -5,9 +5,13 @@ This module provides the main SpeechToTextEngine class that orchestrates
 the transcription process using different STT providers.
 """
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
+import hashlib
 import logging
+import mmap
+import threading
 
 from televoica.core.providers import STTProvider, WhisperProvider
 
@@ -22,15 +26,59 @@ class SpeechToTextEngine:
     and can work with different STT providers.
     """
 
-    def __init__(self, provider: Optional[STTProvider] = None):
+    def __init__(self, provider: Optional[STTProvider] = None, cache_size: int = 512):
         """
         Initialize the speech-to-text engine.
 
         Args:
             provider: STT provider to use. If None, uses WhisperProvider with default settings.
+            cache_size: Maximum number of transcriptions kept in the in-memory cache.
+                Identical audio (e.g. a forwarded voice note) is only transcribed once.
+                Use 0 to disable caching.
         """
         self.provider = provider or WhisperProvider()
-        logger.info(f"SpeechToTextEngine initialized with {self.provider.__class__.__name__}")
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._provider_tag = self._make_provider_tag(self.provider)
+        logger.info("SpeechToTextEngine initialized with %s", self.provider.__class__.__name__)
+
+    @staticmethod
+    def _make_provider_tag(provider: STTProvider) -> str:
+        """Identify a provider and its settings (model, language, ...) for cache keys."""
+        config = sorted((key, repr(value)) for key, value in provider.config.items())
+        return f"{provider.__class__.__name__}:{config}"
+
+    def _cache_get(self, digest: str) -> Optional[str]:
+        """Return the cached transcription for an audio digest, if any."""
+        with self._cache_lock:
+            text = self._cache.get((digest, self._provider_tag))
+            if text is not None:
+                self._cache.move_to_end((digest, self._provider_tag))
+            return text
+
+    def _cache_put(self, digest: str, text: str):
+        """Store a transcription, evicting the least recently used entries."""
+        with self._cache_lock:
+            self._cache[(digest, self._provider_tag)] = text
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    @staticmethod
+    def _hash_bytes(audio_bytes: bytes) -> str:
+        """Hash audio data for use as a cache key."""
+        return hashlib.blake2b(audio_bytes, digest_size=16).hexdigest()
+
+    @classmethod
+    def _hash_file(cls, audio_path: Path) -> str:
+        """Hash a file through a memory map instead of reading it onto the heap."""
+        with open(audio_path, "rb") as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return cls._hash_bytes(mapped)
+            except ValueError:
+                # Empty files cannot be memory-mapped
+                return cls._hash_bytes(b"")
 
     def transcribe_file(self, audio_file: Union[str, Path]) -> str:
         """
@@ -51,8 +99,20 @@ class SpeechToTextEngine:
         if not audio_path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
         
-        logger.info(f"Transcribing file: {audio_path}")
-        return self.provider.transcribe(audio_path)
+        if not self.cache_size:
+            logger.info("Transcribing file: %s", audio_path)
+            return self.provider.transcribe(audio_path)
+        
+        digest = self._hash_file(audio_path)
+        text = self._cache_get(digest)
+        if text is not None:
+            logger.info("Using cached transcription for file: %s", audio_path)
+            return text
+        
+        logger.info("Transcribing file: %s", audio_path)
+        text = self.provider.transcribe(audio_path)
+        self._cache_put(digest, text)
+        return text
 
     def transcribe_bytes(self, audio_bytes: bytes, format: str = "ogg") -> str:
         """
@@ -68,8 +128,20 @@ class SpeechToTextEngine:
         Raises:
             Exception: If transcription fails
         """
-        logger.info(f"Transcribing audio bytes ({len(audio_bytes)} bytes, format: {format})")
-        return self.provider.transcribe_bytes(audio_bytes, format)
+        if not self.cache_size:
+            logger.info("Transcribing audio bytes (%d bytes, format: %s)", len(audio_bytes), format)
+            return self.provider.transcribe_bytes(audio_bytes, format)
+        
+        digest = self._hash_bytes(audio_bytes)
+        text = self._cache_get(digest)
+        if text is not None:
+            logger.info("Using cached transcription for audio bytes (%d bytes)", len(audio_bytes))
+            return text
+        
+        logger.info("Transcribing audio bytes (%d bytes, format: %s)", len(audio_bytes), format)
+        text = self.provider.transcribe_bytes(audio_bytes, format)
+        self._cache_put(digest, text)
+        return text
 
     def set_provider(self, provider: STTProvider):
         """
@@ -79,5 +151,6 @@ class SpeechToTextEngine:
             provider: New STT provider to use
         """
         self.provider = provider
-        logger.info(f"Provider changed to {provider.__class__.__name__}")
+        self._provider_tag = self._make_provider_tag(provider)
+        logger.info("Provider changed to %s", provider.__class__.__name__)
 
@@ -6,12 +6,269 @@ with the SpeechToTextEngine.
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, Union
+import io
+import itertools
 import logging
+import os
+import subprocess
+import tempfile
+import threading
+import wave
+import weakref
 
 logger = logging.getLogger(__name__)
 
+# Sample rate Whisper models expect
+SAMPLE_RATE = 16000
+
+# Suggested RMS level (about -40 dBFS) below which decoded audio counts as silence
+SILENCE_THRESHOLD = 0.01
+
+# Length of the frames the silence check measures, in samples (100 ms)
+SILENCE_FRAME = SAMPLE_RATE // 10
+
+# Containers that may keep their index at the end of the file, so ffmpeg
+# cannot decode them from a pipe and needs a seekable file instead
+_SEEKABLE_FORMATS = {"m4a", "mp4", "mov", "3gp"}
+
+# Loaded Whisper models shared by all WhisperProvider instances, keyed by
+# (backend, model size, device, compute type, compiled, quantized, whisper.cpp
+# threads), least recently used first
+_MODEL_CACHE: "OrderedDict[Tuple[str, str, str, str, bool, bool, Optional[int]], Any]" = (
+    OrderedDict()
+)
+_MODEL_CACHE_LOCK = threading.Lock()
+
+# One lock per model being loaded, so concurrent providers never load the same
+# model twice while loads of other models go ahead
+_MODEL_LOAD_LOCKS: Dict[Tuple, threading.Lock] = {}
+
+# Default number of models kept loaded at once
+MAX_CACHED_MODELS = 2
+
+# Locks serializing transcriptions per loaded openai-whisper model. whisper
+# installs its kv-cache hooks on the shared model for every decode, so two
+# threads decoding with one model at once corrupt each other's output.
+_OPENAI_MODEL_LOCKS: "weakref.WeakKeyDictionary[Any, threading.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+_OPENAI_MODEL_LOCKS_GUARD = threading.Lock()
+
+# whisper.cpp already spreads one transcription over all CPU cores, so
+# transcriptions are run one at a time (its context is not thread-safe either)
+_WHISPER_CPP_LOCK = threading.Lock()
+
+# Audio bytes sent per streaming request (Google allows up to 25 KB)
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# Google Cloud audio encoding per format, built on first use by _encodings()
+_ENCODING_MAP: Optional[Dict[str, Any]] = None
+
+# Interval of gRPC keepalive pings, so idle bot connections are not dropped
+# and re-handshaked on the next request
+KEEPALIVE_TIME_MS = 30_000
+
+
+def _decode_wav(audio_bytes: bytes, buf):
+    """
+    Decode a WAV file that is already in Whisper's format without ffmpeg.
+
+    Only 16 kHz mono 16-bit PCM is handled here; anything else needs
+    resampling or downmixing and is left to ffmpeg.
+
+    Args:
+        audio_bytes: WAV file contents
+        buf: 1-D float32 array to decode into
+
+    Returns:
+        1-D float32 numpy array of samples in [-1, 1], usually a view of ``buf``,
+        or None if the file is not 16 kHz mono 16-bit PCM
+    """
+    import numpy as np
+    
+    try:
+        with wave.open(io.BytesIO(audio_bytes), "rb") as wav:
+            if (wav.getframerate(), wav.getnchannels(), wav.getsampwidth()) != (SAMPLE_RATE, 1, 2):
+                return None
+            frames = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError):
+        return None
+    
+    pcm = np.frombuffer(frames, dtype="<i2")
+    out = buf[:pcm.size] if pcm.size <= buf.size else np.empty(pcm.size, dtype=np.float32)
+    np.multiply(pcm, np.float32(1 / 32768), out=out)
+    return out
+
+
+def _decode_audio(source: Union[bytes, str], buf):
+    """
+    Decode audio to 16 kHz mono float32 samples in memory.
+
+    Audio bytes are piped through ffmpeg, so any format ffmpeg can stream
+    works without writing it to disk first. Containers that need seeking are
+    passed as a file path instead. Samples are read straight into ``buf``;
+    audio longer than the buffer is returned in a newly allocated array.
+
+    Args:
+        source: Encoded audio data, or the path of an audio file
+        buf: 1-D float32 array to decode into
+
+    Returns:
+        1-D float32 numpy array of samples in [-1, 1], usually a view of ``buf``
+
+    Raises:
+        RuntimeError: If ffmpeg is missing or cannot decode the audio
+    """
+    import numpy as np
+    
+    from_file = isinstance(source, str)
+    cmd = [
+        "ffmpeg", "-loglevel", "error", "-threads", "0",
+        "-i", source if from_file else "pipe:0",
+        "-f", "f32le", "-ac", "1", "-ar", str(SAMPLE_RATE),
+        "pipe:1",
+    ]
+    try:
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL if from_file else subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    except FileNotFoundError:
+        raise RuntimeError(
+            "ffmpeg is not installed. "
+            "Install it with: brew install ffmpeg (macOS) or apt install ffmpeg (Linux)"
+        )
+    
+    stderr_chunks = []
+    
+    def feed():
+        try:
+            process.stdin.write(source)
+        except BrokenPipeError:
+            pass  # ffmpeg gave up early, its exit status reports why
+        finally:
+            process.stdin.close()
+    
+    def drain():
+        stderr_chunks.append(process.stderr.read())
+    
+    # Write the input and collect errors from threads, so neither a full
+    # stdout pipe nor a full stderr pipe can block ffmpeg
+    threads = [threading.Thread(target=drain, name="ffmpeg-stderr", daemon=True)]
+    if not from_file:
+        threads.append(threading.Thread(target=feed, name="ffmpeg-feed", daemon=True))
+    for thread in threads:
+        thread.start()
+    
+    try:
+        view = memoryview(buf).cast("B")
+        filled = 0
+        while filled < len(view):
+            read = process.stdout.readinto(view[filled:])
+            if not read:
+                break
+            filled += read
+        
+        # Anything that did not fit into the buffer
+        overflow = process.stdout.read()
+    except BaseException:
+        process.kill()
+        raise
+    finally:
+        process.wait()
+        for thread in threads:
+            thread.join()
+        process.stdout.close()
+        process.stderr.close()
+    
+    stderr = b"".join(stderr_chunks)
+    if process.returncode != 0:
+        raise RuntimeError(f"Failed to decode audio: {stderr.decode(errors='replace').strip()}")
+    
+    samples = buf[:filled // 4]
+    if overflow:
+        samples = np.concatenate([samples, np.frombuffer(overflow, dtype=np.float32)])
+    return samples
+
+
+def _is_silent(samples, threshold: float = SILENCE_THRESHOLD, frame: int = SILENCE_FRAME) -> bool:
+    """
+    Check whether decoded audio is silent.
+
+    The audio is split into short frames and is only silent if every frame
+    is, so a few seconds of quiet speech in a long recording still count as
+    sound. Each frame's RMS level is measured around its mean (so a DC offset
+    does not count as sound). Per-frame sums of squares are computed with
+    einsum, so no temporary array the size of the audio is allocated.
+
+    Args:
+        samples: 1-D float32 array of samples in [-1, 1]
+        threshold: RMS level below which a frame is silent
+        frame: Frame length in samples
+
+    Returns:
+        True if the audio is silent
+    """
+    import numpy as np
+    
+    # Whole frames, then the shorter remainder
+    full = samples.size - samples.size % frame
+    parts = [samples[:full].reshape(-1, frame)] if full else []
+    if full < samples.size:
+        parts.append(samples[full:].reshape(1, -1))
+    
+    limit = threshold * threshold
+    for frames in parts:
+        mean = frames.mean(axis=1)
+        mean_square = np.einsum("ij,ij->i", frames, frames) / frames.shape[1]
+        if np.any(mean_square - mean * mean >= limit):
+            return False
+    return True
+
+
+def _openai_model_lock(model) -> threading.Lock:
+    """Get the lock that serializes transcriptions with an openai-whisper model."""
+    with _OPENAI_MODEL_LOCKS_GUARD:
+        lock = _OPENAI_MODEL_LOCKS.get(model)
+        if lock is None:
+            lock = _OPENAI_MODEL_LOCKS[model] = threading.Lock()
+        return lock
+
+
+def _remove_scratch_files(files: list):
+    """Close and delete scratch files left behind by a WhisperProvider."""
+    for scratch in files:
+        scratch.close()
+        Path(scratch.name).unlink(missing_ok=True)
+
+
+def _encodings() -> Dict[str, Any]:
+    """
+    Get the Google Cloud audio encoding for each supported format.
+
+    The map is built once, on first use, so google-cloud-speech is only
+    imported when the Google provider is actually used.
+
+    Returns:
+        Mapping of audio format (e.g. 'ogg') to RecognitionConfig.AudioEncoding
+    """
+    global _ENCODING_MAP
+    if _ENCODING_MAP is None:
+        from google.cloud import speech
+        
+        encoding = speech.RecognitionConfig.AudioEncoding
+        _ENCODING_MAP = {
+            "ogg": encoding.OGG_OPUS,
+            "mp3": encoding.MP3,
+            "wav": encoding.LINEAR16,
+        }
+    return _ENCODING_MAP
+
 
 class STTProvider(ABC):
     """Abstract base class for speech-to-text providers."""
@@ -58,9 +315,26 @@ class STTProvider(ABC):
         """
         pass
 
+    def preload(self):
+        """
+        Load any model or client the provider needs ahead of the first request.
+
+        Providers load their resources lazily; calling this (for example from a
+        background thread at startup) moves that cost off the first transcription.
+        """
+
 
 class WhisperProvider(STTProvider):
-    """OpenAI Whisper-based speech-to-text provider."""
+    """
+    Whisper-based speech-to-text provider.
+
+    Runs one of three implementations:
+    - 'openai': OpenAI's reference PyTorch implementation
+    - 'faster_whisper': faster-whisper, a CTranslate2 re-implementation that is
+      several times faster on CPU and supports int8 weights
+    - 'whisper_cpp': whisper.cpp through pywhispercpp, with SIMD CPU kernels and
+      quantized ggml weights, suited to small CPU-only machines
+    """
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
@@ -71,26 +345,273 @@ class WhisperProvider(STTProvider):
                 - model: Whisper model size ('tiny', 'base', 'small', 'medium', 'large')
                 - device: Device to run on ('cpu', 'cuda')
                 - language: Language code (e.g., 'en', 'ar')
+                - temp_dir: Directory for temporary audio files (default: system temp dir)
+                - backend: Inference backend ('openai', 'faster_whisper' or 'whisper_cpp',
+                  default: 'openai')
+                - fp16: Run the openai-whisper model in half precision on CUDA
+                  (default: True; always False on CPU)
+                - compute_type: faster-whisper weight type (default: 'int8' on CPU,
+                  'float16' on CUDA)
+                - beam_size: faster-whisper beam size (default: 1, greedy decoding)
+                - vad_filter: Skip silence with faster-whisper's Silero VAD before
+                  decoding (default: the backend's own default)
+                - vad_min_silence_ms: Shortest pause the VAD splits speech on
+                  (default: 500)
+                - batch_size: Number of 30-second windows of a clip faster-whisper
+                  decodes together (default: 1, sequential decoding)
+                - max_cached_models: Number of loaded models shared between provider
+                  instances before the least recently used is dropped (default: 2)
+                - preload: Load the model now instead of on the first request
+                  (default: False)
+                - compile: Compile the openai-whisper model with torch.compile on CUDA
+                  (default: False). Compilation happens while the model loads and
+                  takes a while, so combine it with preload.
+                - quantize: Quantize the openai-whisper model's linear layers to int8
+                  on CPU (default: False). Roughly halves CPU latency at a small
+                  accuracy cost; the faster_whisper backend is usually faster still.
+                - ggml_model: whisper.cpp model name or path to a ggml file, e.g. a
+                  quantized 'base-q5_1' (default: the model size)
+                - n_threads: CPU threads whisper.cpp uses (default: all cores)
+                - silence_threshold: RMS level that no 100 ms frame of decoded audio
+                  may reach for it to be treated as silence and not transcribed,
+                  e.g. SILENCE_THRESHOLD (default: 0, disabled)
         """
         super().__init__(config)
         self.model_size = self.config.get("model", "base")
         self.device = self.config.get("device", "cpu")
         self.language = self.config.get("language", None)
+        self.backend = self.config.get("backend", "openai")
+        if self.backend not in ("openai", "faster_whisper", "whisper_cpp"):
+            raise ValueError(f"Unknown Whisper backend: {self.backend}")
+        # Half precision doubles tensor-core throughput; CPUs do not support it
+        self.fp16 = self.device.startswith("cuda") and self.config.get("fp16", True)
+        self.compute_type = self.config.get(
+            "compute_type", "int8" if self.device == "cpu" else "float16"
+        )
+        self.ggml_model = self.config.get("ggml_model")
+        self.batch_size = self.config.get("batch_size", 1)
+        self.silence_threshold = self.config.get("silence_threshold", 0)
+        self.vad_filter = self.config.get("vad_filter")
+        self.compile = (
+            self.config.get("compile", False)
+            and self.backend == "openai"
+            and self.device.startswith("cuda")
+        )
+        self.quantize = (
+            self.config.get("quantize", False)
+            and self.backend == "openai"
+            and self.device == "cpu"
+        )
         self._model = None
+        self._pipeline = None
+        self._model_lock = threading.Lock()
+        
+        # One reusable scratch file per transcription thread, removed together
+        # with the provider
+        self._scratch = threading.local()
+        self._scratch_files: list = []
+        weakref.finalize(self, _remove_scratch_files, self._scratch_files)
+        
+        if self.config.get("preload", False):
+            self.preload()
 
     def _load_model(self):
         """Lazy load the Whisper model."""
-        if self._model is None:
-            try:
-                import whisper
-                logger.info(f"Loading Whisper model: {self.model_size}")
-                self._model = whisper.load_model(self.model_size, device=self.device)
-                logger.info("Whisper model loaded successfully")
-            except ImportError:
-                raise ImportError(
-                    "openai-whisper is not installed. "
-                    "Install it with: pip install openai-whisper"
-                )
+        if self._model is not None:
+            return
+
+        # A background preload and the first request may race to load the model
+        with self._model_lock:
+            if self._model is None:
+                model = self._get_cached_model()
+                if self.backend == "faster_whisper":
+                    self._pipeline = self._make_pipeline(model)
+                self._model = model
+
+    def _get_cached_model(self):
+        """
+        Get the model for this configuration, loading it if no provider has yet.
+
+        Models are shared between provider instances, so creating another
+        provider with the same settings does not load the weights again.
+        """
+        model_name = self.ggml_model or self.model_size
+        n_threads = self.config.get("n_threads") if self.backend == "whisper_cpp" else None
+        key = (
+            self.backend, model_name, self.device, self.compute_type, self.compile,
+            self.quantize, n_threads,
+        )
+        
+        with _MODEL_CACHE_LOCK:
+            model = self._cache_lookup(key, model_name)
+            if model is not None:
+                return model
+            load_lock = _MODEL_LOAD_LOCKS.setdefault(key, threading.Lock())
+        
+        # Loading can take minutes, so only loads of the same model wait here
+        with load_lock:
+            with _MODEL_CACHE_LOCK:
+                model = self._cache_lookup(key, model_name)
+                if model is not None:
+                    return model
+            
+            if self.backend == "faster_whisper":
+                model = self._load_faster_whisper_model()
+            elif self.backend == "whisper_cpp":
+                model = self._load_whisper_cpp_model()
+            else:
+                model = self._load_openai_model()
+            logger.info("Whisper model loaded successfully")
+            
+            with _MODEL_CACHE_LOCK:
+                _MODEL_CACHE[key] = model
+                _MODEL_LOAD_LOCKS.pop(key, None)
+                max_cached = max(1, self.config.get("max_cached_models", MAX_CACHED_MODELS))
+                while len(_MODEL_CACHE) > max_cached:
+                    evicted, _ = _MODEL_CACHE.popitem(last=False)
+                    logger.info("Dropping cached Whisper model: %s", evicted)
+            
+            return model
+
+    @staticmethod
+    def _cache_lookup(key: Tuple, model_name: str):
+        """Get a loaded model from the cache and mark it as recently used."""
+        model = _MODEL_CACHE.get(key)
+        if model is not None:
+            _MODEL_CACHE.move_to_end(key)
+            logger.info("Reusing loaded Whisper model: %s", model_name)
+        return model
+
+    def _load_openai_model(self):
+        """Load the model with OpenAI's reference implementation."""
+        try:
+            import whisper
+        except ImportError:
+            raise ImportError(
+                "openai-whisper is not installed. "
+                "Install it with: pip install openai-whisper"
+            )
+        
+        logger.info("Loading Whisper model: %s", self.model_size)
+        model = whisper.load_model(self.model_size, device=self.device)
+        
+        if self.compile:
+            model = self._compile_model(model)
+        if self.quantize:
+            model = self._quantize_model(model)
+        
+        return model
+
+    def _quantize_model(self, model):
+        """
+        Quantize the linear layers of a CPU model to int8 with dynamic quantization.
+
+        Weights are stored as int8 and activations are quantized on the fly, so
+        the matrix multiplications that dominate Whisper run on int8 kernels
+        with a quarter of the weight memory traffic. Convolutions, layer norms
+        and embeddings stay in FP32.
+        """
+        import torch
+        from whisper.model import Linear
+        
+        # whisper's Linear only adds dtype casting in forward(); turn it back
+        # into a plain nn.Linear so quantize_dynamic recognizes it
+        for module in model.modules():
+            if type(module) is Linear:
+                module.__class__ = torch.nn.Linear
+        
+        logger.info(
+            "Quantizing Whisper model to int8; transcriptions may be slightly less accurate"
+        )
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+    def _compile_model(self, model):
+        """
+        Compile the encoder and decoder with torch.compile and warm them up.
+
+        The encoder always sees a fixed 30-second mel spectrogram, so it is
+        captured into CUDA graphs ('reduce-overhead'). The decoder's input
+        grows token by token and is compiled with the default mode.
+
+        The warm-up transcription of one second of silence triggers
+        compilation here, instead of on the first real request.
+        """
+        import numpy as np
+        import torch
+        
+        if not hasattr(torch, "compile"):
+            logger.warning("torch.compile requires PyTorch 2.0 or newer, skipping compilation")
+            return model
+        
+        logger.info("Compiling Whisper model with torch.compile")
+        model.encoder = torch.compile(model.encoder, mode="reduce-overhead")
+        model.decoder = torch.compile(model.decoder)
+        
+        model.transcribe(
+            np.zeros(SAMPLE_RATE, dtype=np.float32),
+            language=self.language,
+            fp16=self.fp16,
+        )
+        logger.info("Whisper model compiled")
+        return model
+
+    def _load_faster_whisper_model(self):
+        """Load the model with faster-whisper (CTranslate2)."""
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            raise ImportError(
+                "faster-whisper is not installed. "
+                "Install it with: pip install faster-whisper"
+            )
+        
+        logger.info(
+            "Loading faster-whisper model: %s (%s)", self.model_size, self.compute_type
+        )
+        return WhisperModel(
+            self.model_size, device=self.device, compute_type=self.compute_type
+        )
+
+    def _load_whisper_cpp_model(self):
+        """Load the model with whisper.cpp (pywhispercpp)."""
+        try:
+            from pywhispercpp.model import Model
+        except ImportError:
+            raise ImportError(
+                "pywhispercpp is not installed. "
+                "Install it with: pip install pywhispercpp"
+            )
+        
+        model_name = self.ggml_model or self.model_size
+        logger.info("Loading whisper.cpp model: %s", model_name)
+        return Model(model_name, n_threads=self.config.get("n_threads", os.cpu_count()))
+
+    def _make_pipeline(self, model):
+        """
+        Wrap a faster-whisper model for batched decoding, if enabled.
+
+        Long clips are split into 30-second windows that the batched pipeline
+        decodes together (faster-whisper >= 1.1).
+
+        Returns:
+            BatchedInferencePipeline, or None to decode sequentially
+        """
+        if self.batch_size <= 1:
+            return None
+        
+        try:
+            from faster_whisper import BatchedInferencePipeline
+        except ImportError:
+            logger.warning(
+                "This faster-whisper version has no batched inference, decoding sequentially"
+            )
+            return None
+        
+        return BatchedInferencePipeline(model=model)
+
+    def preload(self):
+        """Load the Whisper model ahead of the first request."""
+        self._load_model()
 
     def transcribe(self, audio_file: Path) -> str:
         """
@@ -104,25 +625,66 @@ class WhisperProvider(STTProvider):
         """
         self._load_model()
         
-        logger.info(f"Transcribing audio file: {audio_file}")
+        logger.info("Transcribing audio file: %s", audio_file)
         
         try:
-            result = self._model.transcribe(
-                str(audio_file),
-                language=self.language,
-                fp16=False  # Use FP32 for CPU compatibility
-            )
-            text = result["text"].strip()
-            logger.info(f"Transcription successful: {len(text)} characters")
+            text = self._run_model(str(audio_file))
+            logger.info("Transcription successful: %d characters", len(text))
             return text
         except Exception as e:
-            logger.error(f"Transcription failed: {e}")
+            logger.error("Transcription failed: %s", e)
             raise
 
+    def _run_model(self, audio) -> str:
+        """
+        Run the loaded model on one input and return the stripped text.
+
+        Args:
+            audio: Audio file path or 16 kHz mono float32 samples
+
+        Returns:
+            Transcribed text
+        """
+        if self.backend == "faster_whisper":
+            options = {"language": self.language, "beam_size": self.config.get("beam_size", 1)}
+            if self.vad_filter is not None:
+                # Only speech segments found by the VAD are decoded, in order
+                options["vad_filter"] = self.vad_filter
+                if self.vad_filter:
+                    options["vad_parameters"] = {
+                        "min_silence_duration_ms": self.config.get("vad_min_silence_ms", 500)
+                    }
+            
+            if self._pipeline is not None:
+                segments, _ = self._pipeline.transcribe(
+                    audio, batch_size=self.batch_size, **options
+                )
+            else:
+                segments, _ = self._model.transcribe(audio, **options)
+            
+            # Segments are generated lazily; decoding happens while joining them
+            return "".join(segment.text for segment in segments).strip()
+        
+        if self.backend == "whisper_cpp":
+            with _WHISPER_CPP_LOCK:
+                segments = self._model.transcribe(audio, language=self.language or "auto")
+            return "".join(segment.text for segment in segments).strip()
+        
+        with _openai_model_lock(self._model):
+            result = self._model.transcribe(
+                audio,
+                language=self.language,
+                fp16=self.fp16,
+            )
+        return result["text"].strip()
+
     def transcribe_bytes(self, audio_bytes: bytes, format: str = "ogg") -> str:
         """
         Transcribe audio bytes using Whisper.
 
+        The audio is decoded in memory and handed to the model as samples,
+        without a temporary file.
+
         Args:
             audio_bytes: Audio data as bytes
             format: Audio format
@@ -130,18 +692,100 @@ class WhisperProvider(STTProvider):
         Returns:
             Transcribed text
         """
-        import tempfile
+        self._load_model()
+        
+        logger.info("Transcribing %d bytes of %s audio", len(audio_bytes), format)
+        
+        if format.lower() in _SEEKABLE_FORMATS:
+            return self._transcribe_via_file(audio_bytes, format)
+        
+        from televoica.core import _bufpool
+        
+        try:
+            buf, audio = self._decode_pooled(audio_bytes, format)
+            try:
+                return self._transcribe_samples(audio)
+            finally:
+                _bufpool.put(buf)
+        except Exception as e:
+            logger.error("Transcription failed: %s", e)
+            raise
+
+    def _decode_pooled(self, audio_bytes: bytes, format: str):
+        """
+        Decode audio into a buffer borrowed from the buffer pool.
+
+        Returns:
+            Tuple of (buffer, samples); the caller returns the buffer to the
+            pool once it is done with the samples
+        """
+        from televoica.core import _bufpool
         
-        # Save bytes to temporary file
-        with tempfile.NamedTemporaryFile(suffix=f".{format}", delete=False) as temp_file:
-            temp_file.write(audio_bytes)
-            temp_path = Path(temp_file.name)
+        buf = _bufpool.get()
+        try:
+            audio = None
+            if format.lower() == "wav":
+                audio = _decode_wav(audio_bytes, buf)
+            if audio is None:
+                audio = _decode_audio(audio_bytes, buf)
+        except BaseException:
+            _bufpool.put(buf)
+            raise
+        
+        return buf, audio
+
+    def _transcribe_samples(self, audio) -> str:
+        """Transcribe decoded samples, skipping empty and silent audio."""
+        if audio.size == 0:
+            logger.info("Decoded audio is empty, nothing to transcribe")
+            return ""
         
+        # Whisper tends to hallucinate text on silence, and skipping it saves a model run
+        if self.silence_threshold and _is_silent(audio, self.silence_threshold):
+            logger.info("Decoded audio is silent, nothing to transcribe")
+            return ""
+        
+        text = self._run_model(audio)
+        logger.info("Transcription successful: %d characters", len(text))
+        return text
+
+    def _transcribe_via_file(self, audio_bytes: bytes, format: str) -> str:
+        """
+        Transcribe audio that ffmpeg can only decode from a seekable file.
+
+        The audio is written to this thread's scratch file, which is
+        overwritten by the next request instead of creating and deleting a
+        temporary file each time. It is then decoded and transcribed like
+        streamed audio.
+        """
+        from televoica.core import _bufpool
+        
+        scratch = self._scratch_file()
+        scratch.seek(0)
+        scratch.truncate()
+        scratch.write(audio_bytes)
+        scratch.flush()
+        
+        buf = _bufpool.get()
         try:
-            return self.transcribe(temp_path)
+            return self._transcribe_samples(_decode_audio(scratch.name, buf))
+        except Exception as e:
+            logger.error("Transcription failed: %s", e)
+            raise
         finally:
-            # Clean up temporary file
-            temp_path.unlink(missing_ok=True)
+            _bufpool.put(buf)
+
+    def _scratch_file(self):
+        """Get the calling thread's scratch file, creating it on first use."""
+        scratch = getattr(self._scratch, "file", None)
+        if scratch is None:
+            scratch = tempfile.NamedTemporaryFile(
+                prefix="televoica-", suffix=".audio", dir=self.config.get("temp_dir"),
+                delete=False,
+            )
+            self._scratch.file = scratch
+            self._scratch_files.append(scratch)
+        return scratch
 
 
 class GoogleCloudSTTProvider(STTProvider):
@@ -155,30 +799,80 @@ class GoogleCloudSTTProvider(STTProvider):
             config: Configuration dictionary with optional keys:
                 - credentials_path: Path to Google Cloud credentials JSON
                 - language_code: Language code (e.g., 'en-US', 'ar-SA')
+                - preload: Create the client now instead of on the first request
+                  (default: False)
+                - pool_size: Number of clients, each with its own gRPC connection,
+                  that requests are spread over (default: half the CPU cores, at least 2)
         """
         super().__init__(config)
         self.credentials_path = self.config.get("credentials_path")
         self.language_code = self.config.get("language_code", "en-US")
+        self.pool_size = max(
+            1, self.config.get("pool_size", max(2, (os.cpu_count() or 1) // 2))
+        )
         self._client = None
+        self._clients = None
+        self._client_lock = threading.Lock()
+        
+        if self.config.get("preload", False):
+            self.preload()
 
     def _load_client(self):
-        """Lazy load the Google Cloud Speech client."""
-        if self._client is None:
+        """
+        Lazy load the pool of Google Cloud Speech clients.
+
+        A single gRPC channel multiplexes every request over one HTTP/2
+        connection, which becomes a bottleneck with many concurrent users.
+        Each pooled client has its own channel, and requests take the next
+        client in turn.
+        """
+        if self._client is not None:
+            return
+        
+        # A background preload and concurrent first requests may race to
+        # create the pool
+        with self._client_lock:
+            if self._client is not None:
+                return
+            
             try:
                 from google.cloud import speech
-                import os
                 
                 if self.credentials_path:
                     os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = self.credentials_path
                 
-                self._client = speech.SpeechClient()
-                logger.info("Google Cloud Speech client initialized")
+                from google.cloud.speech_v1.services.speech.transports import (
+                    SpeechGrpcTransport,
+                )
+                
+                clients = []
+                for _ in range(self.pool_size):
+                    # Long-lived channels, kept open between requests
+                    channel = SpeechGrpcTransport.create_channel(
+                        options=[
+                            ("grpc.keepalive_time_ms", KEEPALIVE_TIME_MS),
+                            ("grpc.keepalive_permit_without_calls", 1),
+                        ]
+                    )
+                    clients.append(
+                        speech.SpeechClient(transport=SpeechGrpcTransport(channel=channel))
+                    )
+                
+                self._clients = itertools.cycle(clients)
+                self._client = clients[0]
+                logger.info(
+                    "Google Cloud Speech client initialized (%d connections)", self.pool_size
+                )
             except ImportError:
                 raise ImportError(
                     "google-cloud-speech is not installed. "
                     "Install it with: pip install google-cloud-speech"
                 )
 
+    def preload(self):
+        """Create the Google Cloud Speech client ahead of the first request."""
+        self._load_client()
+
     def transcribe(self, audio_file: Path) -> str:
         """
         Transcribe audio file using Google Cloud Televoica.
@@ -189,8 +883,7 @@ class GoogleCloudSTTProvider(STTProvider):
         Returns:
             Transcribed text
         """
-        with open(audio_file, "rb") as f:
-            audio_bytes = f.read()
+        audio_bytes = Path(audio_file).read_bytes()
         
         return self.transcribe_bytes(audio_bytes)
 
@@ -210,25 +903,35 @@ class GoogleCloudSTTProvider(STTProvider):
         from google.cloud import speech
         
         # Map format to Google Cloud encoding
-        encoding_map = {
-            "ogg": speech.RecognitionConfig.AudioEncoding.OGG_OPUS,
-            "mp3": speech.RecognitionConfig.AudioEncoding.MP3,
-            "wav": speech.RecognitionConfig.AudioEncoding.LINEAR16,
-        }
-        
-        audio = speech.RecognitionAudio(content=audio_bytes)
+        encodings = _encodings()
         config = speech.RecognitionConfig(
-            encoding=encoding_map.get(format, speech.RecognitionConfig.AudioEncoding.OGG_OPUS),
+            encoding=encodings.get(format, encodings["ogg"]),
             language_code=self.language_code,
         )
+        streaming_config = speech.StreamingRecognitionConfig(
+            config=config, interim_results=False
+        )
+        
+        # Stream the audio in chunks, so recognition starts while it uploads
+        requests = (
+            speech.StreamingRecognizeRequest(audio_content=audio_bytes[i:i + STREAM_CHUNK_SIZE])
+            for i in range(0, len(audio_bytes), STREAM_CHUNK_SIZE)
+        )
         
-        logger.info("Sending audio to Google Cloud Televoica")
-        response = self._client.recognize(config=config, audio=audio)
+        logger.info("Streaming audio to Google Cloud Televoica")
+        responses = next(self._clients).streaming_recognize(
+            config=streaming_config, requests=requests
+        )
         
-        # Combine all transcription results
-        transcripts = [result.alternatives[0].transcript for result in response.results]
+        # Combine all final transcription results
+        transcripts = [
+            result.alternatives[0].transcript
+            for response in responses
+            for result in response.results
+            if result.is_final and result.alternatives
+        ]
         text = " ".join(transcripts).strip()
         
-        logger.info(f"Transcription successful: {len(text)} characters")
+        logger.info("Transcription successful: %d characters", len(text))
         return text
 
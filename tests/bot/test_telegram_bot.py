@@ -0,0 +1,234 @@
+"""Tests for the TelegramSTTBot handlers."""
+
+import asyncio
+import time
+
+import pytest
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+pytest.importorskip("telegram")
+
+from televoica.bot import telegram_bot
+from televoica.bot.telegram_bot import DENY, TelegramSTTBot
+from televoica.config.settings import Settings, TelegramConfig
+from televoica.core.engine import SpeechToTextEngine
+from televoica.core.providers import STTProvider
+
+
+class RecordingProvider(STTProvider):
+    """Provider that records the audio it is given."""
+
+    def __init__(self, config=None, delay=0.0):
+        super().__init__(config)
+        self.delay = delay
+        self.received = []
+
+    def transcribe(self, audio_file: Path) -> str:
+        return "file"
+
+    def transcribe_bytes(self, audio_bytes: bytes, format: str = "ogg") -> str:
+        self.received.append((audio_bytes, format))
+        time.sleep(self.delay)
+        return "hello"
+
+
+def make_update(user_id=1, file_size=100):
+    """Build a voice message update with mocked Telegram API calls."""
+    update = MagicMock()
+    update.message.from_user.id = user_id
+    update.message.voice.file_size = file_size
+    update.message.reply_text = AsyncMock()
+    return update
+
+
+def make_context(audio=b"voice data"):
+    """Build a handler context whose download returns a bytearray, as PTB does."""
+    file = MagicMock()
+    file.download_as_bytearray = AsyncMock(return_value=bytearray(audio))
+    context = MagicMock()
+    context.bot.get_file = AsyncMock(return_value=file)
+    return context
+
+
+@pytest.fixture
+def provider():
+    return RecordingProvider()
+
+
+def make_bot(provider, allowed_users=()):
+    settings = Settings(
+        telegram=TelegramConfig(bot_token="test_token", allowed_users=list(allowed_users))
+    )
+    return TelegramSTTBot(settings, engine=SpeechToTextEngine(provider=provider))
+
+
+@pytest.fixture
+def bot(provider):
+    return make_bot(provider)
+
+
+class TestTelegramSTTBot:
+    """Test cases for TelegramSTTBot."""
+
+    async def test_voice_passes_bytes_to_provider(self, bot, provider):
+        """Test that downloaded bytearrays reach the provider as bytes."""
+        update = make_update()
+
+        await bot.handle_voice(update, make_context(b"voice data"))
+
+        assert provider.received == [(b"voice data", "ogg")]
+        assert type(provider.received[0][0]) is bytes
+        update.message.reply_text.assert_awaited_once_with("📝 Transcription:\n\nhello")
+
+    def test_updates_are_handled_concurrently(self, bot):
+        """Test that the application hands several updates to the handlers at once."""
+        bot._build_application()
+
+        assert bot.application.concurrent_updates >= bot._max_workers > 1
+
+    def test_webhook_hides_token_and_checks_secret(self, bot, monkeypatch):
+        """Test that the webhook URL does not contain the token and updates are signed."""
+        monkeypatch.setattr(telegram_bot, "_install_uvloop", lambda: None)
+        application = MagicMock()
+        monkeypatch.setattr(
+            bot, "_build_application", lambda: setattr(bot, "application", application)
+        )
+
+        bot.run_webhook("https://bot.example.com/")
+
+        kwargs = application.run_webhook.call_args.kwargs
+        assert "test_token" not in kwargs["url_path"]
+        assert kwargs["webhook_url"] == f"https://bot.example.com/{kwargs['url_path']}"
+        assert kwargs["secret_token"]
+        assert kwargs["drop_pending_updates"] is False
+
+    def test_warmup_preloads_without_transcribing(self, bot, provider):
+        """Test that warm-up loads the provider instead of transcribing silence."""
+        provider.preload = MagicMock()
+
+        bot._warmup()
+
+        provider.preload.assert_called_once()
+        assert provider.received == []
+
+    async def test_fast_result_is_a_single_reply(self, bot):
+        """Test that a quick transcription is sent without a processing message."""
+        update = make_update()
+
+        await bot.handle_voice(update, make_context())
+
+        update.message.reply_text.assert_awaited_once_with("📝 Transcription:\n\nhello")
+
+    async def test_slow_result_edits_processing_message(self, monkeypatch):
+        """Test that a slow transcription first replies "processing", then edits it."""
+        monkeypatch.setattr(telegram_bot, "FAST_REPLY_TIMEOUT", 0.01)
+        bot = make_bot(RecordingProvider(delay=0.2))
+        update = make_update()
+        processing_msg = MagicMock()
+        processing_msg.edit_text = AsyncMock()
+        update.message.reply_text.return_value = processing_msg
+
+        await bot.handle_voice(update, make_context())
+
+        update.message.reply_text.assert_awaited_once_with("🎙️ Processing your voice message...")
+        processing_msg.edit_text.assert_awaited_once_with("📝 Transcription:\n\nhello")
+
+    async def test_failed_processing_reply_cancels_transcription(self, bot, monkeypatch):
+        """Test that a failing "processing" reply does not leave the transcription running."""
+        monkeypatch.setattr(telegram_bot, "FAST_REPLY_TIMEOUT", 0.01)
+        cancelled = asyncio.Event()
+
+        async def transcribe(audio_bytes, audio_format):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        monkeypatch.setattr(bot, "_transcribe", transcribe)
+        update = make_update()
+        update.message.reply_text.side_effect = [RuntimeError("network down"), None]
+
+        await bot.handle_voice(update, make_context())
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+        update.message.reply_text.assert_awaited_with(
+            "❌ Error processing voice message: network down"
+        )
+
+    async def test_audio_file_format_from_name(self, bot, provider):
+        """Test that audio files are transcribed in the format of their extension."""
+        update = make_update()
+        update.message.audio.file_size = 100
+        update.message.audio.file_name = "song.MP3"
+
+        await bot.handle_audio(update, make_context(b"audio"))
+
+        assert provider.received == [(b"audio", "mp3")]
+
+    async def test_info_names_current_provider(self, bot):
+        """Test that /info reflects a provider swapped in at runtime."""
+        update = make_update()
+        bot.engine.set_provider(RecordingProvider())
+
+        await bot.info_command(update, MagicMock())
+
+        assert "STT Provider: RecordingProvider" in update.message.reply_text.call_args.args[0]
+
+    async def test_ready_only_once_updater_runs(self, bot):
+        """Test that readiness waits for the application and its updater to run."""
+        application = MagicMock(running=True)
+        application.updater.running = False
+        watcher = asyncio.ensure_future(bot._set_ready_when_running(application))
+
+        await asyncio.sleep(telegram_bot.READY_POLL_INTERVAL * 2)
+        assert not bot._ready.is_set()
+
+        application.updater.running = True
+        await bot.wait_ready(timeout=1)
+        await watcher
+
+    async def test_stop_schedules_clean_shutdown(self, bot):
+        """Test that stop() asks the running application to stop and keeps the threads."""
+        bot.application = MagicMock()
+        bot._loop = asyncio.get_running_loop()
+
+        bot.stop()
+        await asyncio.sleep(0)
+
+        bot.application.stop_running.assert_called_once()
+        bot.application.stop.assert_not_called()
+        assert await bot._transcribe(b"audio", "ogg") == "hello"
+
+    async def test_unauthorized_user_is_rejected(self, provider):
+        """Test that users outside the allow-list get DENY and nothing is transcribed."""
+        bot = make_bot(provider, allowed_users=[1])
+        update = make_update(user_id=2)
+        context = make_context()
+
+        await bot.handle_voice(update, context)
+        await asyncio.sleep(0)  # Let the background reply run
+
+        update.message.reply_text.assert_awaited_once_with(DENY)
+        context.bot.get_file.assert_not_called()
+        assert provider.received == []
+
+    async def test_allowed_user_is_served(self, provider):
+        """Test that users on the allow-list are served."""
+        bot = make_bot(provider, allowed_users=[1])
+
+        await bot.handle_voice(make_update(user_id=1), make_context())
+
+        assert len(provider.received) == 1
+
+    async def test_file_too_large(self, bot, provider):
+        """Test that oversized files are rejected before downloading."""
+        update = make_update(file_size=bot.max_file_size + 1)
+        context = make_context()
+
+        await bot.handle_voice(update, context)
+        await asyncio.sleep(0)
+
+        update.message.reply_text.assert_awaited_once()
+        context.bot.get_file.assert_not_called()
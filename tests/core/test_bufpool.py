@@ -0,0 +1,47 @@
+"""Tests for the decoded audio buffer pool."""
+
+import numpy as np
+import pytest
+
+from televoica.core import _bufpool
+
+
+@pytest.fixture(autouse=True)
+def empty_pool():
+    """Start every test with an empty pool."""
+    while not _bufpool._POOL.empty():
+        _bufpool._POOL.get_nowait()
+    yield
+
+
+class TestBufferPool:
+    """Test cases for the buffer pool."""
+
+    def test_get_standard_buffer(self):
+        """Test that get() returns a float32 buffer of the standard size."""
+        buf = _bufpool.get()
+
+        assert buf.shape == (_bufpool.N_SAMPLES,)
+        assert buf.dtype == np.float32
+
+    def test_released_buffer_is_reused(self):
+        """Test that a released buffer is handed out again."""
+        buf = _bufpool.get()
+        _bufpool.put(buf)
+
+        assert _bufpool.get() is buf
+
+    def test_other_sizes_are_not_pooled(self):
+        """Test that non-standard buffers are allocated and never pooled."""
+        buf = _bufpool.get(1000)
+        _bufpool.put(buf)
+
+        assert buf.shape == (1000,)
+        assert _bufpool._POOL.empty()
+
+    def test_pool_is_bounded(self):
+        """Test that at most MAX_POOLED buffers are kept."""
+        for _ in range(_bufpool.MAX_POOLED + 2):
+            _bufpool.put(np.empty(_bufpool.N_SAMPLES, dtype=np.float32))
+
+        assert _bufpool._POOL.qsize() == _bufpool.MAX_POOLED
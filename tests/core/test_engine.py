@@ -90,3 +90,107 @@ class TestSpeechToTextEngine:
         
         assert result == f"Mock transcription of {audio_file.name}"
 
+
+
+class CountingProvider(MockProvider):
+    """Mock STT provider that counts how often it is called."""
+    
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.calls = 0
+    
+    def transcribe(self, audio_file: Path) -> str:
+        self.calls += 1
+        return super().transcribe(audio_file)
+    
+    def transcribe_bytes(self, audio_bytes: bytes, format: str = "ogg") -> str:
+        self.calls += 1
+        return super().transcribe_bytes(audio_bytes, format)
+
+
+class TestTranscriptionCache:
+    """Test cases for the SpeechToTextEngine transcription cache."""
+    
+    def test_repeated_bytes_are_cached(self):
+        """Test that identical audio bytes are only transcribed once."""
+        provider = CountingProvider()
+        engine = SpeechToTextEngine(provider=provider)
+        
+        first = engine.transcribe_bytes(b"same audio")
+        second = engine.transcribe_bytes(b"same audio")
+        
+        assert first == second
+        assert provider.calls == 1
+    
+    def test_different_bytes_are_not_cached(self):
+        """Test that different audio is transcribed separately."""
+        provider = CountingProvider()
+        engine = SpeechToTextEngine(provider=provider)
+        
+        engine.transcribe_bytes(b"first audio")
+        engine.transcribe_bytes(b"second audio")
+        
+        assert provider.calls == 2
+    
+    def test_repeated_file_is_cached(self, tmp_path):
+        """Test that a file with identical content is only transcribed once."""
+        audio_file = tmp_path / "test.mp3"
+        audio_file.write_bytes(b"fake audio data")
+        
+        provider = CountingProvider()
+        engine = SpeechToTextEngine(provider=provider)
+        
+        engine.transcribe_file(audio_file)
+        engine.transcribe_file(audio_file)
+        
+        assert provider.calls == 1
+    
+    def test_empty_file_is_hashed(self, tmp_path):
+        """Test that empty files can be transcribed with caching enabled."""
+        audio_file = tmp_path / "empty.mp3"
+        audio_file.write_bytes(b"")
+        
+        provider = CountingProvider()
+        engine = SpeechToTextEngine(provider=provider)
+        
+        assert engine.transcribe_file(audio_file) == "Mock transcription of empty.mp3"
+    
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache never grows beyond cache_size."""
+        provider = CountingProvider()
+        engine = SpeechToTextEngine(provider=provider, cache_size=2)
+        
+        engine.transcribe_bytes(b"a")
+        engine.transcribe_bytes(b"bb")
+        engine.transcribe_bytes(b"a")  # "a" becomes most recently used
+        engine.transcribe_bytes(b"ccc")  # evicts "bb"
+        assert provider.calls == 3
+        
+        engine.transcribe_bytes(b"a")
+        assert provider.calls == 3
+        
+        engine.transcribe_bytes(b"bb")
+        assert provider.calls == 4
+    
+    def test_cache_disabled(self):
+        """Test that cache_size=0 disables caching."""
+        provider = CountingProvider()
+        engine = SpeechToTextEngine(provider=provider, cache_size=0)
+        
+        engine.transcribe_bytes(b"same audio")
+        engine.transcribe_bytes(b"same audio")
+        
+        assert provider.calls == 2
+    
+    def test_cache_is_per_provider_config(self):
+        """Test that changing provider settings does not reuse old results."""
+        provider = CountingProvider({"language": "en"})
+        engine = SpeechToTextEngine(provider=provider)
+        engine.transcribe_bytes(b"same audio")
+        
+        other = CountingProvider({"language": "ar"})
+        engine.set_provider(other)
+        engine.transcribe_bytes(b"same audio")
+        
+        assert provider.calls == 1
+        assert other.calls == 1
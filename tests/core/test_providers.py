@@ -1,9 +1,20 @@
 """Tests for STT providers."""
 
+import gc
+import io
+import itertools
+import os
+import sys
+import threading
+import time
+import wave
+
+import numpy as np
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
+from televoica.core import providers
 from televoica.core.providers import (
     STTProvider,
     WhisperProvider,
@@ -11,6 +22,23 @@ from televoica.core.providers import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_model_cache(monkeypatch):
+    """Keep models and encodings loaded by one test from leaking into the next."""
+    monkeypatch.setattr(providers, "_ENCODING_MAP", None)
+    providers._MODEL_CACHE.clear()
+    yield
+    providers._MODEL_CACHE.clear()
+
+
+@pytest.fixture
+def mock_whisper():
+    """WhisperProvider with a mocked model, so no weights are loaded."""
+    provider = WhisperProvider()
+    provider._model = MagicMock()
+    return provider
+
+
 class TestSTTProvider:
     """Test cases for the abstract STTProvider."""
     
@@ -19,7 +47,6 @@ class TestSTTProvider:
         with pytest.raises(TypeError):
             STTProvider()
 
-
 class TestWhisperProvider:
     """Test cases for WhisperProvider."""
     
@@ -44,6 +71,114 @@ class TestWhisperProvider:
         assert provider.device == "cuda"
         assert provider.language == "en"
     
+    def test_fp16_only_on_cuda(self):
+        """Test that half precision is used on CUDA unless disabled."""
+        assert WhisperProvider({"device": "cuda"}).fp16
+        assert not WhisperProvider({"device": "cuda", "fp16": False}).fp16
+        assert not WhisperProvider({"device": "cpu", "fp16": True}).fp16
+
+    def test_faster_whisper_compute_type_defaults(self):
+        """Test that faster-whisper uses int8 on CPU and float16 on CUDA."""
+        assert WhisperProvider({"backend": "faster_whisper"}).compute_type == "int8"
+        assert WhisperProvider(
+            {"backend": "faster_whisper", "device": "cuda"}
+        ).compute_type == "float16"
+        assert WhisperProvider(
+            {"backend": "faster_whisper", "compute_type": "int8_float16"}
+        ).compute_type == "int8_float16"
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend is rejected."""
+        with pytest.raises(ValueError, match="Unknown Whisper backend"):
+            WhisperProvider({"backend": "nope"})
+
+    def test_transcribe_with_faster_whisper(self, tmp_path):
+        """Test transcription through the faster-whisper backend."""
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = (
+            iter([Mock(text=" Hello"), Mock(text=" world ")]),
+            Mock(),
+        )
+        faster_whisper = MagicMock()
+        faster_whisper.WhisperModel.return_value = mock_model
+
+        audio_file = tmp_path / "test.mp3"
+        audio_file.write_text("fake audio")
+
+        with patch.dict(sys.modules, {"faster_whisper": faster_whisper}):
+            provider = WhisperProvider({"backend": "faster_whisper", "language": "en"})
+            result = provider.transcribe(audio_file)
+
+        assert result == "Hello world"
+        faster_whisper.WhisperModel.assert_called_once_with(
+            "base", device="cpu", compute_type="int8"
+        )
+        mock_model.transcribe.assert_called_once_with(
+            str(audio_file), language="en", beam_size=1
+        )
+
+    def test_faster_whisper_batched_pipeline(self, tmp_path):
+        """Test that batch_size > 1 decodes through the batched pipeline."""
+        pipeline = MagicMock()
+        pipeline.transcribe.return_value = (iter([Mock(text=" Batched ")]), Mock())
+        faster_whisper = MagicMock()
+        faster_whisper.BatchedInferencePipeline.return_value = pipeline
+
+        audio_file = tmp_path / "test.mp3"
+        audio_file.write_text("fake audio")
+
+        with patch.dict(sys.modules, {"faster_whisper": faster_whisper}):
+            provider = WhisperProvider({"backend": "faster_whisper", "batch_size": 4})
+            result = provider.transcribe(audio_file)
+
+        assert result == "Batched"
+        faster_whisper.BatchedInferencePipeline.assert_called_once_with(
+            model=faster_whisper.WhisperModel.return_value
+        )
+        pipeline.transcribe.assert_called_once_with(
+            str(audio_file), batch_size=4, language=None, beam_size=1
+        )
+
+    def test_faster_whisper_vad_filter(self, tmp_path):
+        """Test that the VAD filter options are passed to faster-whisper."""
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = (iter([Mock(text=" Speech")]), Mock())
+        faster_whisper = MagicMock()
+        faster_whisper.WhisperModel.return_value = mock_model
+
+        audio_file = tmp_path / "test.mp3"
+        audio_file.write_text("fake audio")
+
+        with patch.dict(sys.modules, {"faster_whisper": faster_whisper}):
+            provider = WhisperProvider({"backend": "faster_whisper", "vad_filter": True})
+            provider.transcribe(audio_file)
+
+        kwargs = mock_model.transcribe.call_args.kwargs
+        assert kwargs["vad_filter"] is True
+        assert kwargs["vad_parameters"] == {"min_silence_duration_ms": 500}
+
+    def test_transcribe_with_whisper_cpp(self, tmp_path):
+        """Test transcription through the whisper.cpp backend."""
+        pywhispercpp_model = MagicMock()
+        model = pywhispercpp_model.Model.return_value
+        model.transcribe.return_value = [Mock(text=" Hello"), Mock(text=" world")]
+
+        audio_file = tmp_path / "test.wav"
+        audio_file.write_text("fake audio")
+
+        with patch.dict(sys.modules, {
+            "pywhispercpp": MagicMock(model=pywhispercpp_model),
+            "pywhispercpp.model": pywhispercpp_model,
+        }):
+            provider = WhisperProvider({
+                "backend": "whisper_cpp", "ggml_model": "base-q5_1", "n_threads": 2,
+            })
+            result = provider.transcribe(audio_file)
+
+        assert result == "Hello world"
+        pywhispercpp_model.Model.assert_called_once_with("base-q5_1", n_threads=2)
+        model.transcribe.assert_called_once_with(str(audio_file), language="auto")
+
     @patch('whisper.load_model')
     def test_load_model(self, mock_load_model):
         """Test lazy loading of Whisper model."""
@@ -59,38 +194,255 @@ class TestWhisperProvider:
         mock_load_model.assert_called_once_with("base", device="cpu")
 
     @patch('whisper.load_model')
-    def test_transcribe(self, mock_load_model, tmp_path):
+    def test_model_shared_between_instances(self, mock_load_model):
+        """Test that providers with the same settings share one loaded model."""
+        first = WhisperProvider({"model": "base"})
+        second = WhisperProvider({"model": "base"})
+
+        first._load_model()
+        second._load_model()
+
+        assert first._model is second._model
+        mock_load_model.assert_called_once_with("base", device="cpu")
+
+    @patch('whisper.load_model')
+    def test_model_cache_evicts_least_recently_used(self, mock_load_model):
+        """Test that the model cache keeps at most max_cached_models models."""
+        mock_load_model.side_effect = lambda size, device: MagicMock(name=size)
+
+        for size in ("tiny", "base", "tiny", "small"):
+            WhisperProvider({"model": size, "max_cached_models": 2})._load_model()
+
+        assert [key[1] for key in providers._MODEL_CACHE] == ["tiny", "small"]
+        assert mock_load_model.call_count == 3
+
+    def test_model_load_does_not_block_other_models(self):
+        """Test that loading one model does not hold up loads of other models."""
+        release = threading.Event()
+
+        def load(self):
+            if self.model_size == "large":
+                release.wait(5)
+            return MagicMock(name=self.model_size)
+
+        with patch.object(WhisperProvider, "_load_openai_model", load):
+            slow = threading.Thread(target=WhisperProvider({"model": "large"})._load_model)
+            slow.start()
+            try:
+                started = time.monotonic()
+                WhisperProvider({"model": "tiny"})._load_model()
+                assert time.monotonic() - started < 1
+            finally:
+                release.set()
+                slow.join()
+
+    def test_model_cache_key_includes_whisper_cpp_threads(self):
+        """Test that whisper.cpp models with different thread counts are not shared."""
+        with patch.object(
+            WhisperProvider, "_load_whisper_cpp_model", side_effect=lambda: MagicMock()
+        ) as load:
+            first = WhisperProvider({"backend": "whisper_cpp", "n_threads": 2})
+            second = WhisperProvider({"backend": "whisper_cpp", "n_threads": 8})
+            first._load_model()
+            second._load_model()
+
+        assert load.call_count == 2
+        assert first._model is not second._model
+
+    def test_compile_only_on_cuda(self):
+        """Test that compilation is only enabled for the openai backend on CUDA."""
+        assert WhisperProvider({"device": "cuda", "compile": True}).compile
+        assert not WhisperProvider({"device": "cpu", "compile": True}).compile
+        assert not WhisperProvider({"device": "cuda"}).compile
+        assert not WhisperProvider(
+            {"device": "cuda", "compile": True, "backend": "faster_whisper"}
+        ).compile
+
+    def test_quantize_only_on_cpu(self):
+        """Test that quantization is only enabled for the openai backend on CPU."""
+        assert WhisperProvider({"quantize": True}).quantize
+        assert not WhisperProvider().quantize
+        assert not WhisperProvider({"quantize": True, "device": "cuda"}).quantize
+        assert not WhisperProvider({"quantize": True, "backend": "faster_whisper"}).quantize
+
+    def test_preload_loads_model(self):
+        """Test that preload eagerly loads the model."""
+        provider = WhisperProvider()
+
+        with patch.object(provider, "_load_model") as mock_load:
+            provider.preload()
+
+        mock_load.assert_called_once_with()
+
+    def test_preload_config_loads_model_on_init(self):
+        """Test that the preload option loads the model in the constructor."""
+        with patch.object(WhisperProvider, "_load_model") as mock_load:
+            WhisperProvider({"preload": True})
+
+        mock_load.assert_called_once_with()
+
+    def test_transcribe(self, mock_whisper, tmp_path):
         """Test transcription of audio file."""
         # Setup mock
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = {"text": "  Test transcription  "}
-        mock_load_model.return_value = mock_model
+        mock_whisper._model.transcribe.return_value = {"text": "  Test transcription  "}
 
         # Create temporary audio file
         audio_file = tmp_path / "test.mp3"
         audio_file.write_text("fake audio")
 
         # Transcribe
-        provider = WhisperProvider()
-        result = provider.transcribe(audio_file)
+        result = mock_whisper.transcribe(audio_file)
 
         assert result == "Test transcription"
-        mock_model.transcribe.assert_called_once()
+        mock_whisper._model.transcribe.assert_called_once()
 
-    @patch('whisper.load_model')
-    def test_transcribe_bytes(self, mock_load_model, tmp_path):
+    @patch('televoica.core.providers._decode_audio')
+    def test_transcribe_bytes(self, mock_decode, mock_whisper):
         """Test transcription of audio bytes."""
         # Setup mock
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = {"text": "Test transcription"}
-        mock_load_model.return_value = mock_model
+        mock_whisper._model.transcribe.return_value = {"text": "Test transcription"}
+        samples = np.full(16000, 0.5, dtype=np.float32)
+        samples[::2] = -0.5
+        mock_decode.return_value = samples
 
         # Transcribe bytes
-        provider = WhisperProvider()
         audio_bytes = b"fake audio data"
-        result = provider.transcribe_bytes(audio_bytes, format="ogg")
+        result = mock_whisper.transcribe_bytes(audio_bytes, format="ogg")
 
         assert result == "Test transcription"
+        assert mock_decode.call_args[0][0] == audio_bytes
+        assert mock_whisper._model.transcribe.call_args[0][0] is samples
+
+    def test_openai_transcriptions_take_turns(self, mock_whisper):
+        """Test that concurrent openai-whisper runs on one model do not overlap."""
+        running = []
+        overlapped = []
+
+        def transcribe(audio, **kwargs):
+            running.append(audio)
+            overlapped.append(len(running) > 1)
+            time.sleep(0.05)
+            running.remove(audio)
+            return {"text": "text"}
+
+        mock_whisper._model.transcribe.side_effect = transcribe
+        threads = [
+            threading.Thread(target=mock_whisper._run_model, args=(f"clip{i}",))
+            for i in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert overlapped == [False, False, False]
+
+    @pytest.mark.parametrize("format", ["ogg", "m4a"])
+    @patch('televoica.core.providers._decode_audio')
+    def test_transcribe_bytes_skips_silence(self, mock_decode, format, mock_whisper):
+        """Test that silent audio is not handed to the model when the gate is on."""
+        mock_decode.return_value = np.full(16000, 0.3, dtype=np.float32)  # DC offset only
+        mock_whisper.silence_threshold = providers.SILENCE_THRESHOLD
+
+        assert mock_whisper.transcribe_bytes(b"fake audio data", format=format) == ""
+        mock_whisper._model.transcribe.assert_not_called()
+
+    @patch('televoica.core.providers._decode_audio')
+    def test_silence_gate_off_by_default(self, mock_decode, mock_whisper):
+        """Test that quiet audio is still transcribed unless a threshold is set."""
+        mock_decode.return_value = np.full(16000, 0.001, dtype=np.float32)
+        mock_whisper._model.transcribe.return_value = {"text": "quiet"}
+
+        assert mock_whisper.transcribe_bytes(b"fake audio data", format="ogg") == "quiet"
+
+    def test_decode_wav_without_ffmpeg(self):
+        """Test that 16 kHz mono 16-bit WAV files are decoded in Python."""
+        pcm = np.array([0, 16384, -32768, 32767], dtype="<i2")
+        data = io.BytesIO()
+        with wave.open(data, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(16000)
+            wav.writeframes(pcm.tobytes())
+
+        buf = np.empty(16, dtype=np.float32)
+        samples = providers._decode_wav(data.getvalue(), buf)
+
+        assert samples.base is buf
+        np.testing.assert_allclose(samples, [0.0, 0.5, -1.0, 32767 / 32768])
+
+    def test_decode_wav_other_formats_fall_back(self):
+        """Test that WAV files needing resampling are left to ffmpeg."""
+        data = io.BytesIO()
+        with wave.open(data, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(44100)
+            wav.writeframes(b"\x00\x00" * 10)
+
+        buf = np.empty(16, dtype=np.float32)
+
+        assert providers._decode_wav(data.getvalue(), buf) is None
+        assert providers._decode_wav(b"not a wav file", buf) is None
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script as ffmpeg")
+    def test_decode_audio_survives_verbose_errors(self, tmp_path, monkeypatch):
+        """Test that ffmpeg writing lots of errors cannot deadlock the decoder."""
+        ffmpeg = tmp_path / "ffmpeg"
+        ffmpeg.write_text("#!/bin/sh\nhead -c 300000 /dev/zero | tr '\\0' x >&2\nexit 1\n")
+        ffmpeg.chmod(0o755)
+        monkeypatch.setenv("PATH", str(tmp_path), prepend=os.pathsep)
+
+        with pytest.raises(RuntimeError, match="Failed to decode audio"):
+            providers._decode_audio(b"corrupt" * 1000, np.empty(16000, dtype=np.float32))
+
+    def test_is_silent(self):
+        """Test the RMS silence check."""
+        rng = np.random.default_rng(0)
+        noise = rng.normal(0, 0.001, 16000).astype(np.float32)
+        speech = rng.normal(0, 0.1, 16000).astype(np.float32)
+
+        assert providers._is_silent(noise)
+        assert providers._is_silent(noise + 0.5)
+        assert not providers._is_silent(speech)
+        assert not providers._is_silent(noise, threshold=0.0001)
+        assert not providers._is_silent(speech[:1000])
+
+    def test_is_silent_keeps_short_quiet_speech(self):
+        """Test that a few seconds of quiet speech in a long recording are not skipped."""
+        rng = np.random.default_rng(0)
+        audio = rng.normal(0, 0.002, 60 * 16000).astype(np.float32)  # Room noise
+        audio[20 * 16000:26 * 16000] += rng.normal(0, 0.022, 6 * 16000).astype(np.float32)
+
+        assert not providers._is_silent(audio)
+
+    @patch('televoica.core.providers._decode_audio')
+    def test_transcribe_bytes_seekable_format_uses_file(self, mock_decode, tmp_path):
+        """Test that containers ffmpeg cannot stream are decoded from a file."""
+        provider = WhisperProvider({"temp_dir": str(tmp_path)})
+        provider._model = MagicMock()
+        provider._model.transcribe.return_value = {"text": "From file"}
+        seen = []
+
+        def decode(source, buf):
+            seen.append((Path(source), Path(source).read_bytes()))
+            buf[:2] = [0.5, -0.5]
+            return buf[:2]
+
+        mock_decode.side_effect = decode
+        assert provider.transcribe_bytes(b"longer audio data", format="m4a") == "From file"
+        assert provider.transcribe_bytes(b"short", format="mp4") == "From file"
+
+        # The same scratch file is overwritten for each request
+        (first_path, first_data), (second_path, second_data) = seen
+        assert first_path == second_path
+        assert first_path.parent == tmp_path
+        assert (first_data, second_data) == (b"longer audio data", b"short")
+
+        # And removed together with the provider
+        del provider
+        gc.collect()
+        assert not first_path.exists()
 
 
 class TestGoogleCloudSTTProvider:
@@ -137,3 +489,94 @@ class TestGoogleCloudSTTProvider:
         assert provider._client == mock_client
         mock_load_client.assert_called_once()
 
+    def test_transcribe_bytes_streams_audio(self):
+        """Test that audio is streamed in chunks and final results are joined."""
+        speech = MagicMock()
+        speech.StreamingRecognizeRequest.side_effect = lambda audio_content: audio_content
+        google_cloud = MagicMock(speech=speech)
+
+        def result(text, is_final=True):
+            return Mock(is_final=is_final, alternatives=[Mock(transcript=text)])
+
+        sent = []
+
+        def streaming_recognize(config, requests):
+            sent.extend(requests)
+            return [
+                Mock(results=[result("Hello"), result("ignored", is_final=False)]),
+                Mock(results=[result("world")]),
+            ]
+
+        provider = GoogleCloudSTTProvider()
+        provider._client = MagicMock()
+        provider._client.streaming_recognize.side_effect = streaming_recognize
+        provider._clients = itertools.cycle([provider._client])
+
+        audio_bytes = b"x" * (providers.STREAM_CHUNK_SIZE * 2 + 10)
+        with patch.dict(sys.modules, {"google.cloud": google_cloud, "google.cloud.speech": speech}):
+            text = provider.transcribe_bytes(audio_bytes, format="ogg")
+
+        assert text == "Hello world"
+        assert [len(chunk) for chunk in sent] == [
+            providers.STREAM_CHUNK_SIZE, providers.STREAM_CHUNK_SIZE, 10
+        ]
+        assert b"".join(sent) == audio_bytes
+
+    def test_client_pool_round_robin(self):
+        """Test that requests are spread over a pool of clients."""
+        speech = MagicMock()
+        speech.SpeechClient.side_effect = lambda transport: MagicMock()
+        transports = MagicMock()
+        modules = {
+            "google.cloud": MagicMock(speech=speech),
+            "google.cloud.speech": speech,
+            "google.cloud.speech_v1.services.speech.transports": transports,
+        }
+
+        provider = GoogleCloudSTTProvider({"pool_size": 3})
+        with patch.dict(sys.modules, modules):
+            provider.preload()
+
+        assert speech.SpeechClient.call_count == 3
+        assert transports.SpeechGrpcTransport.create_channel.call_count == 3
+        clients = [next(provider._clients) for _ in range(4)]
+        assert len({id(client) for client in clients[:3]}) == 3
+        assert clients[3] is clients[0] is provider._client
+
+    def test_client_pool_created_once_under_concurrency(self):
+        """Test that concurrent first requests build a single pool of clients."""
+        speech = MagicMock()
+        speech.SpeechClient.side_effect = lambda transport: MagicMock()
+        transports = MagicMock()
+        transports.SpeechGrpcTransport.create_channel.side_effect = (
+            lambda options: time.sleep(0.01)
+        )
+        modules = {
+            "google.cloud": MagicMock(speech=speech),
+            "google.cloud.speech": speech,
+            "google.cloud.speech_v1.services.speech.transports": transports,
+        }
+
+        provider = GoogleCloudSTTProvider({"pool_size": 2})
+        with patch.dict(sys.modules, modules):
+            threads = [threading.Thread(target=provider.preload) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert transports.SpeechGrpcTransport.create_channel.call_count == 2
+
+    def test_encodings_built_once(self):
+        """Test that the format to encoding map is built on first use and reused."""
+        speech = MagicMock()
+        google_cloud = MagicMock(speech=speech)
+        encoding = speech.RecognitionConfig.AudioEncoding
+
+        with patch.dict(sys.modules, {"google.cloud": google_cloud, "google.cloud.speech": speech}):
+            encodings = providers._encodings()
+
+        assert encodings["ogg"] is encoding.OGG_OPUS
+        assert encodings["mp3"] is encoding.MP3
+        assert encodings["wav"] is encoding.LINEAR16
+        assert providers._encodings() is encodings
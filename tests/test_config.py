@@ -6,9 +6,11 @@ from pathlib import Path
 from unittest.mock import patch
 
 from televoica.config.settings import (
+    DEFAULT_TEMP_DIR,
     Settings,
     TelegramConfig,
     load_config,
+    _load_config_file,
     _load_from_env,
 )
 
@@ -22,6 +24,7 @@ class TestSettings:
         
         assert settings.telegram_bot is False
         assert settings.stt.provider == "whisper"
+        assert settings.stt.whisper_batch_size == 1
         assert settings.telegram.enabled is False
         assert settings.log_level == "INFO"
     
@@ -48,6 +51,51 @@ class TestSettings:
         assert settings.temp_dir.is_dir()
 
 
+class TestTempDir:
+    """Test cases for choosing a RAM-backed temp directory."""
+    
+    def test_default_falls_back_to_shm(self, tmp_path):
+        """Test that /dev/shm is used when the default /tmp is on disk."""
+        shm_dir = tmp_path / "shm" / "televoica"
+        ram_backed = lambda path: path == shm_dir.parent
+        
+        with (
+            patch("televoica.config.settings._is_ram_backed", side_effect=ram_backed),
+            patch("televoica.config.settings.SHM_TEMP_DIR", shm_dir),
+        ):
+            settings = Settings(ram_temp_dir=True)
+        
+        assert settings.temp_dir == shm_dir
+        assert shm_dir.is_dir()
+    
+    def test_shm_not_used_by_default(self, tmp_path):
+        """Test that the default temp_dir is kept unless ram_temp_dir is enabled."""
+        shm_dir = tmp_path / "shm" / "televoica"
+        ram_backed = lambda path: path == shm_dir.parent
+        
+        with (
+            patch("televoica.config.settings._is_ram_backed", side_effect=ram_backed),
+            patch("televoica.config.settings.SHM_TEMP_DIR", shm_dir),
+        ):
+            settings = Settings()
+        
+        assert settings.temp_dir == DEFAULT_TEMP_DIR
+    
+    def test_default_kept_when_ram_backed(self):
+        """Test that the default is kept when /tmp is already tmpfs."""
+        with patch("televoica.config.settings._is_ram_backed", return_value=True):
+            settings = Settings(ram_temp_dir=True)
+        
+        assert settings.temp_dir == DEFAULT_TEMP_DIR
+    
+    def test_custom_temp_dir_is_kept(self, tmp_path):
+        """Test that an explicit temp_dir is never replaced."""
+        with patch("televoica.config.settings._is_ram_backed", return_value=False):
+            settings = Settings(temp_dir=tmp_path / "custom", ram_temp_dir=True)
+        
+        assert settings.temp_dir == tmp_path / "custom"
+
+
 class TestLoadFromEnv:
     """Test cases for loading configuration from environment variables."""
     
@@ -73,6 +121,7 @@ class TestLoadFromEnv:
             "STT_WHISPER_MODEL": "large",
             "STT_WHISPER_DEVICE": "cuda",
             "STT_WHISPER_LANGUAGE": "en",
+            "STT_WHISPER_BACKEND": "faster_whisper",
         }
         
         with patch.dict(os.environ, env_vars):
@@ -80,6 +129,7 @@ class TestLoadFromEnv:
             assert config["whisper_model"] == "large"
             assert config["whisper_device"] == "cuda"
             assert config["whisper_language"] == "en"
+            assert config["whisper_backend"] == "faster_whisper"
     
     def test_load_telegram_settings(self):
         """Test loading Telegram settings from env."""
@@ -95,6 +145,46 @@ class TestLoadFromEnv:
             assert config["telegram_allowed_users"] == [123, 456, 789]
             assert config["telegram_max_file_size_mb"] == 50
     
+    def test_load_preload_models(self):
+        """Test loading the model preload flag from env."""
+        with patch.dict(os.environ, {"STT_PRELOAD_MODELS": "true"}):
+            config = _load_from_env()
+            assert config["preload_models"] is True
+    
+    def test_load_whisper_batch_size(self):
+        """Test loading the faster-whisper batch size from env."""
+        with patch.dict(os.environ, {"STT_WHISPER_BATCH_SIZE": "4"}):
+            config = _load_from_env()
+            assert config["whisper_batch_size"] == 4
+    
+    def test_load_whisper_silence_threshold(self):
+        """Test loading the silence threshold from env."""
+        with patch.dict(os.environ, {"STT_WHISPER_SILENCE_THRESHOLD": "0.01"}):
+            config = _load_from_env()
+            assert config["whisper_silence_threshold"] == 0.01
+    
+    def test_load_max_workers(self):
+        """Test loading the transcription worker count from env."""
+        with patch.dict(os.environ, {"STT_MAX_WORKERS": "4"}):
+            config = _load_from_env()
+            assert config["max_workers"] == 4
+    
+    def test_empty_values_are_ignored(self):
+        """Test that empty environment variables fall back to defaults."""
+        env_vars = {
+            "STT_WHISPER_LANGUAGE": "",
+            "TELEGRAM_ALLOWED_USERS": "",
+        }
+        
+        with patch.dict(os.environ, env_vars, clear=True):
+            assert _load_from_env() == {}
+    
+    def test_custom_prefix(self):
+        """Test loading prefixed settings with a custom prefix."""
+        with patch.dict(os.environ, {"TV_WHISPER_MODEL": "small"}, clear=True):
+            config = _load_from_env("TV_")
+            assert config == {"whisper_model": "small"}
+    
     def test_load_log_level(self):
         """Test loading log level from env."""
         with patch.dict(os.environ, {"STT_LOG_LEVEL": "DEBUG"}):
@@ -130,3 +220,49 @@ class TestLoadConfig:
             assert settings.stt.whisper_model == "base"
             assert settings.log_level == "INFO"
 
+
+
+class TestLoadConfigFile:
+    """Test cases for loading configuration files."""
+    
+    def test_load_json_file(self, tmp_path):
+        """Test loading a JSON configuration file."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"log_level": "DEBUG", "whisper_model": "small"}')
+        
+        config = _load_config_file(config_file)
+        
+        assert config == {"log_level": "DEBUG", "whisper_model": "small"}
+    
+    def test_load_yaml_file(self, tmp_path):
+        """Test loading a YAML configuration file."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("log_level: DEBUG\nwhisper_model: small\n")
+        
+        config = _load_config_file(config_file)
+        
+        assert config == {"log_level": "DEBUG", "whisper_model": "small"}
+    
+    def test_load_yaml_without_c_loader(self, tmp_path, monkeypatch):
+        """Test that YAML still loads when PyYAML is built without libyaml."""
+        yaml = pytest.importorskip("yaml")
+        monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("log_level: DEBUG\n")
+        
+        assert _load_config_file(config_file) == {"log_level": "DEBUG"}
+    
+    def test_load_empty_yaml_file(self, tmp_path):
+        """Test that an empty YAML file yields an empty config."""
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("")
+        
+        assert _load_config_file(config_file) == {}
+    
+    def test_unsupported_format(self, tmp_path):
+        """Test that unsupported file formats are rejected."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text("")
+        
+        with pytest.raises(ValueError, match="Unsupported config file format"):
+            _load_config_file(config_file)